@@ -0,0 +1,106 @@
+"""기존 스키마 (create_all로 생성되던 초기 테이블)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+create_all로 이미 테이블이 만들어진 DB는 이 리비전으로 stamp한 뒤 업그레이드합니다.
+
+    alembic stamp 0001 && alembic upgrade head
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+user_role = sa.Enum("ADMIN", "USER", name="userrole")
+auth_provider = sa.Enum("EMAIL", "GOOGLE", "KAKAO", name="authprovider")
+application_status = sa.Enum("APPLIED", "CANCELLED", name="applicationstatus")
+notification_type = sa.Enum("SCHEDULE", "NOTICE", "REMINDER", name="notificationtype")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("phone", sa.String(20), nullable=True),
+        sa.Column("role", user_role, nullable=True),
+        sa.Column("provider", auth_provider, nullable=True),
+        sa.Column("provider_id", sa.String(255), nullable=True),
+        sa.Column("fcm_token", sa.String(500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "schedules",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("end_time", sa.Time(), nullable=False),
+        sa.Column("location", sa.String(255), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_schedules_id", "schedules", ["id"])
+    op.create_index("ix_schedules_date", "schedules", ["date"])
+
+    op.create_table(
+        "applications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("schedule_id", sa.Integer(), sa.ForeignKey("schedules.id"), nullable=False),
+        sa.Column("status", application_status, nullable=True),
+        sa.Column("applied_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("cancelled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("user_id", "schedule_id", name="uq_user_schedule"),
+    )
+    op.create_index("ix_applications_id", "applications", ["id"])
+
+    op.create_table(
+        "notices",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("is_important", sa.Boolean(), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_notices_id", "notices", ["id"])
+
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("type", notification_type, nullable=True),
+        sa.Column("is_read", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_notifications_id", "notifications", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("notifications")
+    op.drop_table("notices")
+    op.drop_table("applications")
+    op.drop_table("schedules")
+    op.drop_table("users")
+
+    bind = op.get_bind()
+    for enum_type in (notification_type, application_status, auth_provider, user_role):
+        enum_type.drop(bind, checkfirst=True)
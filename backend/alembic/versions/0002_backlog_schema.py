@@ -0,0 +1,126 @@
+"""정원 / 지원자 수, 반복 일정 템플릿, 작업 잠금 및 조회용 인덱스
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+schedules에 (date, start_time, location) 유일 제약이 추가되므로 같은 슬롯에
+중복 일정이 있으면 먼저 정리해야 합니다. applicant_count는 applications의
+APPLIED 건수로 채워집니다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 사용자 목록 필터 / 정렬 / 앞부분 검색
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+    op.create_index("ix_users_role_created_at", "users", ["role", "created_at"])
+    op.create_index("ix_users_provider_created_at", "users", ["provider", "created_at"])
+    op.create_index("ix_users_name_prefix", "users", ["name"], postgresql_ops={"name": "varchar_pattern_ops"})
+    op.create_index("ix_users_email_prefix", "users", ["email"], postgresql_ops={"email": "varchar_pattern_ops"})
+
+    # 반복 일정 템플릿
+    op.create_table(
+        "schedule_templates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("weekday", sa.Integer(), nullable=False),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("end_time", sa.Time(), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("capacity", sa.Integer(), nullable=True),
+        sa.Column("valid_from", sa.Date(), nullable=False),
+        sa.Column("valid_until", sa.Date(), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_schedule_templates_id", "schedule_templates", ["id"])
+
+    op.create_table(
+        "schedule_template_exceptions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "template_id",
+            sa.Integer(),
+            sa.ForeignKey("schedule_templates.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.UniqueConstraint("template_id", "date", name="uq_template_exception_date"),
+    )
+    op.create_index("ix_schedule_template_exceptions_id", "schedule_template_exceptions", ["id"])
+
+    # 일정 정원 / 비정규화된 지원자 수 / 템플릿 회차 / 슬롯 유일 제약
+    with op.batch_alter_table("schedules") as batch:
+        batch.add_column(sa.Column("capacity", sa.Integer(), nullable=True))
+        batch.add_column(sa.Column("applicant_count", sa.Integer(), nullable=False, server_default="0"))
+        batch.add_column(sa.Column("template_id", sa.Integer(), nullable=True))
+        batch.create_foreign_key(
+            "schedules_template_id_fkey",
+            "schedule_templates",
+            ["template_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+        batch.create_unique_constraint("uq_schedule_slot", ["date", "start_time", "location"])
+
+    op.execute(
+        """
+        UPDATE schedules SET applicant_count = (
+            SELECT COUNT(*) FROM applications
+            WHERE applications.schedule_id = schedules.id
+              AND applications.status = 'APPLIED'
+        )
+        """
+    )
+
+    # 주기 작업 실행 잠금
+    op.create_table(
+        "job_leases",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("owner", sa.String(255), nullable=True),
+        sa.Column("lease_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_completed_on", sa.Date(), nullable=True),
+    )
+
+    # 알림 커서 페이지네이션 / 안 읽은 알림 부분 인덱스
+    op.create_index("ix_notifications_user_created_at_id", "notifications", ["user_id", "created_at", "id"])
+    op.create_index(
+        "ix_notifications_user_unread",
+        "notifications",
+        ["user_id"],
+        postgresql_where=sa.text("is_read = false"),
+        sqlite_where=sa.text("is_read = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_user_unread", table_name="notifications")
+    op.drop_index("ix_notifications_user_created_at_id", table_name="notifications")
+
+    op.drop_table("job_leases")
+
+    with op.batch_alter_table("schedules") as batch:
+        batch.drop_constraint("uq_schedule_slot", type_="unique")
+        batch.drop_constraint("schedules_template_id_fkey", type_="foreignkey")
+        batch.drop_column("template_id")
+        batch.drop_column("applicant_count")
+        batch.drop_column("capacity")
+
+    op.drop_table("schedule_template_exceptions")
+    op.drop_table("schedule_templates")
+
+    op.drop_index("ix_users_email_prefix", table_name="users")
+    op.drop_index("ix_users_name_prefix", table_name="users")
+    op.drop_index("ix_users_provider_created_at", table_name="users")
+    op.drop_index("ix_users_role_created_at", table_name="users")
+    op.drop_index("ix_users_created_at_id", table_name="users")
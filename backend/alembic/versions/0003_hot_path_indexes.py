@@ -0,0 +1,36 @@
+"""지원 / 공지 조회용 복합 인덱스
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+PostgreSQL에서는 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY로 생성합니다
+(트랜잭션 밖에서 실행). 인덱스 사용 여부는 아래 명령으로 확인합니다.
+
+    python -m app.commands.check_query_plans
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_applications_schedule_status", "applications", ["schedule_id", "status"]),
+    ("ix_applications_user_status_applied_at", "applications", ["user_id", "status", "applied_at"]),
+    ("ix_notices_important_created_at_id", "notices", ["is_important", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""리마인더 알림 중복 방지 키
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+notifications에 대상 일정 / 일정 날짜를 추가하고 (사용자, 일정, 종류, 일정 날짜)
+유일 제약을 둡니다. 일정이 없는 기존 알림은 NULL이므로 제약에 걸리지 않습니다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("notifications") as batch:
+        batch.add_column(sa.Column("schedule_id", sa.Integer(), nullable=True))
+        batch.add_column(sa.Column("schedule_date", sa.Date(), nullable=True))
+        batch.create_foreign_key(
+            "notifications_schedule_id_fkey",
+            "schedules",
+            ["schedule_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+        batch.create_unique_constraint(
+            "uq_notification_schedule",
+            ["user_id", "schedule_id", "type", "schedule_date"],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("notifications") as batch:
+        batch.drop_constraint("uq_notification_schedule", type_="unique")
+        batch.drop_constraint("notifications_schedule_id_fkey", type_="foreignkey")
+        batch.drop_column("schedule_date")
+        batch.drop_column("schedule_id")
@@ -0,0 +1,35 @@
+"""일정 슬롯 유일 인덱스에서 장소 NULL 비교
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+uq_schedule_slot 유일 제약을 (date, start_time, COALESCE(location, '')) 유일
+인덱스로 바꿔 장소가 없는 일정끼리도 같은 슬롯으로 취급합니다. 장소가 없는 중복
+일정이 있으면 먼저 정리해야 합니다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("schedules") as batch:
+        batch.drop_constraint("uq_schedule_slot", type_="unique")
+    op.create_index(
+        "uq_schedule_slot",
+        "schedules",
+        ["date", "start_time", sa.text("coalesce(location, '')")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_schedule_slot", table_name="schedules")
+    with op.batch_alter_table("schedules") as batch:
+        batch.create_unique_constraint("uq_schedule_slot", ["date", "start_time", "location"])
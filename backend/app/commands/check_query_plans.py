@@ -0,0 +1,176 @@
+"""
+주요 조회 쿼리 실행 계획 점검
+
+라우터 / 서비스가 실제로 실행하는 쿼리(같은 쿼리 생성 함수 사용)에 EXPLAIN을
+실행하고, 행 수가 --min-rows 이상인 테이블을 순차 스캔(Seq Scan / SCAN table)하는
+계획이 있으면 실패(exit code 1)로 종료합니다. 데이터를 채운 DB
+(python -m app.commands.seed)에서 실행합니다. tests/test_query_plans.py가 같은
+점검을 pytest로 실행합니다.
+
+    python -m app.commands.check_query_plans --min-rows 1000
+
+PostgreSQL은 EXPLAIN (FORMAT JSON), SQLite는 EXPLAIN QUERY PLAN 결과를 검사합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, select, text
+
+from app.database import engine
+from app.models.application import Application, ApplicationStatus
+from app.models.schedule import Schedule
+from app.models.user import UserRole
+from app.routers.admin import user_list_query
+from app.routers.applications import my_applications_query, roster_query, schedule_applicants_query
+from app.routers.notices import notice_list_query
+from app.routers.notifications import notification_list_query, read_all_statement, unread_count_query
+from app.services.reminder_service import reminder_recipients_query
+from app.services.schedule_service import (
+    applied_schedule_ids_query,
+    day_schedules_query,
+    get_month_range,
+    month_schedules_query,
+)
+from app.utils.pagination import encode_cursor
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(.*)$")
+
+TABLES = ("users", "schedules", "applications", "notices", "notifications")
+
+
+def _explain_sql(conn, statement, prefix: str) -> str:
+    """
+    EXPLAIN 문 생성
+
+    파라미터는 리터럴로 넣고 문자열로 실행합니다. 원래 쿼리의 결과 컬럼 타입이
+    EXPLAIN 결과 행에 적용되지 않도록 Core 문장으로 감싸지 않습니다.
+    """
+    compiled = statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    return f"{prefix} {compiled}"
+
+
+def hot_queries(user_id: int, schedule_id: int, target_date: date) -> Dict[str, object]:
+    """점검 대상 쿼리 (라우터 / 서비스의 쿼리 생성 함수와 기본 페이지 크기 사용)"""
+    start_date, end_date = get_month_range(target_date.year, target_date.month)
+    cursor_now = datetime.now(timezone.utc)
+
+    return {
+        "schedules: month": month_schedules_query(start_date, end_date),
+        "schedules: day": day_schedules_query(target_date),
+        "schedules: applied ids": applied_schedule_ids_query(user_id, [schedule_id]),
+        "applications: my (upcoming)": my_applications_query(user_id, "upcoming", target_date).limit(51),
+        "applications: my (past)": my_applications_query(user_id, "past", target_date).limit(51),
+        "applications: my (applied)": my_applications_query(
+            user_id, "all", target_date, status_filter=ApplicationStatus.APPLIED,
+        ).limit(51),
+        "applications: schedule applicants": schedule_applicants_query(schedule_id),
+        "applications: roster": roster_query(and_(Schedule.date >= start_date, Schedule.date < end_date)),
+        "reminders: day": reminder_recipients_query(target_date),
+        "notices: list": notice_list_query().limit(11),
+        "notices: cursor": notice_list_query(encode_cursor(True, cursor_now, 2**31 - 1)).limit(11),
+        "notifications: list": notification_list_query(user_id).limit(51),
+        "notifications: cursor": notification_list_query(user_id, encode_cursor(cursor_now, 2**31 - 1)).limit(51),
+        "notifications: unread count": unread_count_query(user_id),
+        "notifications: read all": read_all_statement(user_id),
+        "users: admin list": user_list_query().limit(101),
+        "users: role filter": user_list_query(role=UserRole.USER).limit(101),
+    }
+
+
+def _postgresql_seq_scans(plan: dict) -> List[str]:
+    tables = []
+    if plan.get("Node Type") == "Seq Scan":
+        tables.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        tables.extend(_postgresql_seq_scans(child))
+    return tables
+
+
+async def explain(conn, statement) -> Tuple[List[str], List[str]]:
+    """(순차 스캔한 테이블 목록, 계획 요약 줄) 반환"""
+    if conn.dialect.name == "postgresql":
+        raw = (await conn.exec_driver_sql(_explain_sql(conn, statement, "EXPLAIN (FORMAT JSON)"))).scalar_one()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        return _postgresql_seq_scans(plan), [json.dumps(plan, ensure_ascii=False)]
+
+    rows = (await conn.exec_driver_sql(_explain_sql(conn, statement, "EXPLAIN QUERY PLAN"))).all()
+    details = [row[-1] for row in rows]
+    tables = []
+    for detail in details:
+        match = _SQLITE_SCAN.match(detail)
+        if match and "USING" not in match.group(2):
+            tables.append(match.group(1))
+    return tables, details
+
+
+async def _sample_ids(conn) -> Tuple[int, int, date]:
+    """점검에 쓸 사용자 / 일정 / 날짜 (지원 / 알림이 가장 많은 값)"""
+    user_id = await conn.scalar(
+        select(Application.user_id)
+        .group_by(Application.user_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    schedule_id = await conn.scalar(
+        select(Schedule.id).order_by(Schedule.applicant_count.desc()).limit(1)
+    )
+    target_date = await conn.scalar(select(func.max(Schedule.date)))
+    return user_id or 1, schedule_id or 1, target_date or date.today()
+
+
+async def check_plans(conn, min_rows: int, verbose: bool = False, only: Optional[str] = None) -> List[str]:
+    """
+    주요 쿼리의 실행 계획 점검 후 순차 스캔이 있는 쿼리 이름 목록 반환
+
+    점검 쿼리 중 UPDATE도 있으므로 호출자가 롤백해야 합니다.
+    """
+    row_counts = {}
+    for table in TABLES:
+        row_counts[table] = await conn.scalar(text(f"SELECT COUNT(*) FROM {table}"))
+    print("행 수: " + ", ".join(f"{table}={count}" for table, count in row_counts.items()))
+
+    failures = []
+    user_id, schedule_id, target_date = await _sample_ids(conn)
+    for name, statement in hot_queries(user_id, schedule_id, target_date).items():
+        if only and only not in name:
+            continue
+        tables, details = await explain(conn, statement)
+        large = [table for table in tables if row_counts.get(table, 0) >= min_rows]
+        if large:
+            failures.append(name)
+            print(f"FAIL  {name}: 순차 스캔 {', '.join(large)}")
+        else:
+            print(f"ok    {name}")
+        if verbose or large:
+            for detail in details:
+                print(f"        {detail}")
+    return failures
+
+
+async def main(min_rows: int, analyze: bool, verbose: bool, only: Optional[str]) -> int:
+    async with engine.connect() as conn:
+        if analyze:
+            await conn.execute(text("ANALYZE"))
+        failures = await check_plans(conn, min_rows, verbose, only)
+        await conn.rollback()
+
+    await engine.dispose()
+    print(f"{len(failures)}개 쿼리에서 순차 스캔 발견" if failures else "모든 쿼리가 인덱스를 사용합니다")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-rows", type=int, default=1000, help="이 행 수 이상인 테이블의 순차 스캔만 실패로 처리")
+    parser.add_argument("--no-analyze", action="store_true", help="점검 전 ANALYZE(통계 갱신) 생략")
+    parser.add_argument("--verbose", action="store_true", help="모든 쿼리의 실행 계획 출력")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 쿼리만 점검")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.min_rows, not args.no_analyze, args.verbose, args.only)))
@@ -0,0 +1,46 @@
+"""
+초기 관리자 계정 생성
+
+INITIAL_ADMIN_EMAIL 계정이 없을 때만 생성합니다 (여러 번 실행해도 안전).
+배포 시 마이그레이션 직후 한 번 실행합니다.
+
+    alembic upgrade head && python -m app.commands.create_admin
+"""
+
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+from app.database import SessionLocal, engine
+from app.models.user import AuthProvider, User, UserRole
+from app.utils.security import get_password_hash
+
+
+async def main():
+    async with SessionLocal() as db:
+        admin = await db.scalar(select(User.id).where(User.email == settings.INITIAL_ADMIN_EMAIL))
+        if admin:
+            print(f"관리자 계정이 이미 있습니다: {settings.INITIAL_ADMIN_EMAIL}")
+        else:
+            db.add(User(
+                email=settings.INITIAL_ADMIN_EMAIL,
+                password_hash=get_password_hash(settings.INITIAL_ADMIN_PASSWORD),
+                name=settings.INITIAL_ADMIN_NAME,
+                role=UserRole.ADMIN,
+                provider=AuthProvider.EMAIL,
+            ))
+            try:
+                await db.commit()
+                print(f"초기 관리자 계정 생성: {settings.INITIAL_ADMIN_EMAIL}")
+            except IntegrityError:
+                # 다른 인스턴스가 동시에 생성한 경우
+                await db.rollback()
+                print(f"관리자 계정이 이미 있습니다: {settings.INITIAL_ADMIN_EMAIL}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,27 @@
+"""
+지원자 수 재계산
+
+applications 테이블의 APPLIED 건수로 schedules.applicant_count를 일괄 보정합니다.
+
+    python -m app.commands.reconcile_applicant_counts
+"""
+
+import asyncio
+
+from app.database import SessionLocal, engine
+from app.services.cache import cache
+from app.services.schedule_service import reconcile_applicant_counts
+
+
+async def main():
+    async with SessionLocal() as db:
+        updated = await reconcile_applicant_counts(db)
+    print(f"지원자 수 보정 완료: {updated}개 일정")
+
+    # 월별 일정 캐시는 CACHE_TTL_SECONDS 이내에 만료되어 보정된 값으로 갱신됩니다
+    await cache.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,393 @@
+"""
+벤치마크 / 프로파일링용 합성 데이터 생성
+
+사용자 / 일정 / 지원 / 공지 / 알림을 같은 시드와 기준일이면 항상 같은 내용으로
+생성하고, PostgreSQL은 COPY(asyncpg copy_records_to_table), SQLite는
+executemany로 한 트랜잭션에 적재합니다. 일정의 applicant_count는 생성한
+APPLIED 지원 수와 일치합니다.
+
+    python -m app.commands.seed --preset medium --reset
+
+사용자 이메일 / 비밀번호는 benchmarks.run 기본값(bench{i}@example.com /
+benchmark-password)과 같으며, 해싱 비용을 줄이기 위해 모든 사용자가 같은
+비밀번호 해시를 공유합니다. --reset은 관리자 계정을 제외한 데이터를 지웁니다.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import Iterator, List, Sequence, Tuple
+
+from sqlalchemy import Date, DateTime, Time, delete, func, select, text
+
+from app.database import engine
+from app.models.application import Application
+from app.models.notice import Notice
+from app.models.notification import Notification
+from app.models.schedule import Schedule
+from app.models.schedule_template import ScheduleTemplate, ScheduleTemplateException
+from app.models.user import User, UserRole
+from app.routers.notices import NOTICE_TOTAL_CACHE_KEY, NOTICES_VERSION
+from app.services.cache import cache
+from app.services.schedule_service import invalidate_schedule_months
+from app.services.template_service import invalidate_templates
+from app.utils.http_cache import bump_versions
+from app.utils.security import get_password_hash
+
+PRESETS = {
+    # 사용자 500명, 일정 약 1.8천 개, 지원 약 8천 건, 알림 약 1만 건
+    "small": {
+        "users": 500,
+        "years": 1,
+        "schedules_per_day": 4,
+        "capacity": (4, 8),
+        "notices": 50,
+        "notifications_per_user": 20,
+    },
+    # 사용자 5천 명, 일정 약 1.4만 개, 지원 약 9.5만 건, 알림 약 20만 건
+    "medium": {
+        "users": 5_000,
+        "years": 3,
+        "schedules_per_day": 12,
+        "capacity": (6, 12),
+        "notices": 500,
+        "notifications_per_user": 40,
+    },
+    # 사용자 2만 명, 일정 약 4.6만 개, 지원 약 42만 건, 알림 약 100만 건
+    "large": {
+        "users": 20_000,
+        "years": 5,
+        "schedules_per_day": 24,
+        "capacity": (8, 16),
+        "notices": 2_000,
+        "notifications_per_user": 50,
+    },
+}
+
+TIME_SLOTS = [(dtime(hour), dtime(hour + 2)) for hour in range(8, 20, 2)]
+SCHEDULE_TITLES = ["전시대 봉사", "오전 전시대", "오후 전시대", "저녁 전시대", "역 앞 전시대"]
+NOTIFICATION_TITLES = {
+    "SCHEDULE": "새 봉사 일정이 등록되었습니다",
+    "NOTICE": "새 공지사항이 있습니다",
+    "REMINDER": "내일 봉사 일정이 있습니다",
+}
+
+# 미래 일정도 생성하는 기간 (지원 / 달력 조회 대상)
+FUTURE_DAYS = 90
+BATCH_DAYS = 30
+BATCH_ROWS = 50_000
+
+USER_COLUMNS = ("id", "email", "password_hash", "name", "phone", "role", "provider", "created_at", "updated_at")
+SCHEDULE_FIELDS = (
+    "id", "title", "description", "date", "start_time", "end_time", "location",
+    "capacity", "applicant_count", "created_by", "created_at", "updated_at",
+)
+APPLICATION_COLUMNS = ("id", "user_id", "schedule_id", "status", "applied_at", "cancelled_at")
+NOTICE_COLUMNS = ("id", "title", "content", "is_important", "created_by", "created_at", "updated_at")
+NOTIFICATION_COLUMNS = ("id", "user_id", "title", "body", "type", "is_read", "created_at")
+
+
+def _at(day: date, rng: random.Random) -> datetime:
+    """해당 날짜의 임의 시각 (UTC)"""
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc) + timedelta(seconds=rng.randrange(86_400))
+
+
+class Generator:
+    """시드 / 기준일이 같으면 같은 행을 만드는 합성 데이터 생성기"""
+
+    def __init__(self, preset: dict, seed: int, anchor: date, first_user_id: int, admin_id):
+        self.preset = preset
+        self.seed = seed
+        self.anchor = anchor
+        self.first_user_id = first_user_id
+        self.admin_id = admin_id
+        self.start_date = anchor - timedelta(days=365 * preset["years"])
+        self.end_date = anchor + timedelta(days=FUTURE_DAYS)
+
+        location_count = math.ceil(preset["schedules_per_day"] / len(TIME_SLOTS))
+        self.slots = [
+            (start, end, f"장안 전시대 {n + 1:02d}")
+            for n in range(location_count)
+            for start, end in TIME_SLOTS
+        ]
+
+    def users(self, email_pattern: str, password_hash: str) -> List[tuple]:
+        rng = random.Random(f"{self.seed}:users")
+        rows = []
+        for i in range(self.preset["users"]):
+            created_at = _at(self.start_date - timedelta(days=rng.randrange(365)), rng)
+            rows.append((
+                self.first_user_id + i,
+                email_pattern.format(i=i),
+                password_hash,
+                f"봉사자{i}",
+                f"010-{rng.randrange(10_000):04d}-{rng.randrange(10_000):04d}",
+                "USER",
+                "EMAIL",
+                created_at,
+                created_at,
+            ))
+        return rows
+
+    def schedule_batches(self) -> Iterator[Tuple[List[tuple], List[tuple]]]:
+        """BATCH_DAYS일 단위의 (일정 행, 지원 행) 묶음"""
+        rng = random.Random(f"{self.seed}:schedules")
+        low, high = self.preset["capacity"]
+        user_count = self.preset["users"]
+        per_day = min(self.preset["schedules_per_day"], len(self.slots))
+        schedule_id = 1
+        application_id = 1
+
+        day = self.start_date
+        while day < self.end_date:
+            schedules, applications = [], []
+            batch_end = min(day + timedelta(days=BATCH_DAYS), self.end_date)
+            while day < batch_end:
+                created_at = _at(day - timedelta(days=rng.randint(7, 30)), rng)
+                opens_until = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+                for start, end, location in sorted(rng.sample(self.slots, per_day)):
+                    capacity = None if rng.random() < 0.1 else rng.randint(low, high)
+                    limit = capacity or high
+                    # 지난 일정은 대부분 찼고, 다가오는 일정은 아직 모집 중
+                    wanted = rng.randint(limit // 2, limit) if day < self.anchor else rng.randint(0, limit)
+
+                    applied = 0
+                    for user_index in rng.sample(range(user_count), min(wanted, user_count)):
+                        applied_at = created_at + (opens_until - created_at) * rng.random()
+                        if rng.random() < 0.12:
+                            status, cancelled_at = "CANCELLED", applied_at + timedelta(hours=rng.randint(1, 72))
+                        else:
+                            status, cancelled_at = "APPLIED", None
+                            applied += 1
+                        applications.append((
+                            application_id,
+                            self.first_user_id + user_index,
+                            schedule_id,
+                            status,
+                            applied_at,
+                            cancelled_at,
+                        ))
+                        application_id += 1
+
+                    schedules.append((
+                        schedule_id,
+                        rng.choice(SCHEDULE_TITLES),
+                        None,
+                        day,
+                        start,
+                        end,
+                        location,
+                        capacity,
+                        applied,
+                        self.admin_id,
+                        created_at,
+                        created_at,
+                    ))
+                    schedule_id += 1
+                day += timedelta(days=1)
+            yield schedules, applications
+
+    def notices(self) -> List[tuple]:
+        rng = random.Random(f"{self.seed}:notices")
+        span = (self.anchor - self.start_date).days
+        rows = []
+        for i in range(self.preset["notices"]):
+            created_at = _at(self.start_date + timedelta(days=rng.randrange(span)), rng)
+            rows.append((
+                i + 1,
+                f"공지사항 {i + 1}",
+                "봉사 일정과 유의사항 안내입니다.\n" * rng.randint(1, 20),
+                rng.random() < 0.1,
+                self.admin_id,
+                created_at,
+                created_at,
+            ))
+        return rows
+
+    def notification_batches(self) -> Iterator[List[tuple]]:
+        rng = random.Random(f"{self.seed}:notifications")
+        average = self.preset["notifications_per_user"]
+        notification_id = 1
+        rows = []
+        for i in range(self.preset["users"]):
+            for _ in range(rng.randint(average // 2, average * 3 // 2)):
+                age = rng.randrange(180)
+                kind = rng.choice(("SCHEDULE", "NOTICE", "REMINDER"))
+                rows.append((
+                    notification_id,
+                    self.first_user_id + i,
+                    NOTIFICATION_TITLES[kind],
+                    "자세한 내용은 앱에서 확인하세요.",
+                    kind,
+                    # 최근 2주 알림은 일부만 읽음
+                    rng.random() < (0.5 if age < 14 else 0.95),
+                    _at(self.anchor - timedelta(days=age), rng),
+                ))
+                notification_id += 1
+            if len(rows) >= BATCH_ROWS:
+                yield rows
+                rows = []
+        if rows:
+            yield rows
+
+
+class Loader:
+    """테이블별 적재 (PostgreSQL COPY / SQLite executemany) 및 처리량 집계"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.postgresql = conn.dialect.name == "postgresql"
+        self.totals = {}
+
+    def _sqlite_processor(self, column_type):
+        """SQLite 바인드 변환. 날짜 / 시간은 SQLAlchemy 저장 형식과 같은 문자열을 isoformat으로 바로 만든다"""
+        if isinstance(column_type, DateTime):
+            # 오프셋 접미사("+00:00")를 잘라 SQLAlchemy와 같은 "YYYY-MM-DD HH:MM:SS.ffffff" 형식으로 저장
+            return lambda value: value.isoformat(" ", "microseconds")[:26]
+        if isinstance(column_type, Date):
+            return date.isoformat
+        if isinstance(column_type, Time):
+            return lambda value: value.isoformat("microseconds")
+        dialect = self.conn.dialect
+        return column_type.dialect_impl(dialect).bind_processor(dialect)
+
+    def _sqlite_rows(self, table, columns: Sequence[str], rows: List[tuple]) -> List[tuple]:
+        """컬럼 타입의 바인드 변환(날짜 / 시간 문자열 등)을 미리 적용한 튜플"""
+        processors = [self._sqlite_processor(table.c[name].type) for name in columns]
+        if not any(processors):
+            return rows
+        # 행 단위 튜플 재구성 대신 컬럼 단위로 변환한 뒤 다시 묶는다
+        values = list(zip(*rows))
+        for index, process in enumerate(processors):
+            if process is None:
+                continue
+            column = values[index]
+            if None in column:
+                values[index] = [None if value is None else process(value) for value in column]
+            else:
+                values[index] = list(map(process, column))
+        return list(zip(*values))
+
+    async def load(self, table, columns: Sequence[str], rows: List[tuple]) -> None:
+        if not rows:
+            return
+        started = time.perf_counter()
+        if self.postgresql:
+            raw = await self.conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(table.name, records=rows, columns=list(columns))
+        else:
+            # SQLAlchemy 문장 컴파일 / 행별 dict 변환 없이 드라이버 executemany로 적재
+            sql = f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+            await self.conn.exec_driver_sql(sql, self._sqlite_rows(table, columns, rows))
+
+        count, seconds = self.totals.get(table.name, (0, 0.0))
+        self.totals[table.name] = (count + len(rows), seconds + time.perf_counter() - started)
+
+    def report(self) -> None:
+        for name, (count, seconds) in self.totals.items():
+            rate = count / seconds if seconds else 0
+            print(f"  {name}: {count:,}행 {seconds:.1f}초 ({rate:,.0f}행/초)")
+        count = sum(count for count, _ in self.totals.values())
+        seconds = sum(seconds for _, seconds in self.totals.values())
+        rate = count / seconds if seconds else 0
+        print(f"  합계: {count:,}행 {seconds:.1f}초 ({rate:,.0f}행/초)")
+
+
+async def reset(conn) -> None:
+    """관리자 계정을 제외한 데이터 삭제"""
+    if conn.dialect.name == "postgresql":
+        await conn.execute(text(
+            "TRUNCATE notifications, applications, schedule_template_exceptions, "
+            "schedule_templates, schedules, notices"
+        ))
+    else:
+        for model in (Notification, Application, ScheduleTemplateException, Schedule, ScheduleTemplate, Notice):
+            await conn.execute(delete(model))
+    await conn.execute(delete(User).where(User.role != UserRole.ADMIN))
+
+
+async def has_data(conn) -> bool:
+    for query in (
+        select(func.count()).select_from(User).where(User.role != UserRole.ADMIN),
+        select(func.count()).select_from(Schedule),
+        select(func.count()).select_from(Notice),
+    ):
+        if await conn.scalar(query):
+            return True
+    return False
+
+
+async def main(args) -> int:
+    preset = PRESETS[args.preset]
+    anchor = date.fromisoformat(args.anchor) if args.anchor else date.today()
+    started = time.perf_counter()
+
+    async with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            # 이 연결에서만 적용 (적재 중 fsync 생략)
+            await conn.execute(text("PRAGMA synchronous = OFF"))
+
+        if args.reset:
+            await reset(conn)
+        elif await has_data(conn):
+            print("데이터가 이미 있습니다. --reset으로 기존 데이터를 지운 뒤 생성하세요 (관리자 계정은 유지).")
+            return 1
+
+        admin_id = await conn.scalar(select(func.min(User.id)).where(User.role == UserRole.ADMIN))
+        first_user_id = (await conn.scalar(select(func.max(User.id))) or 0) + 1
+        generator = Generator(preset, args.seed, anchor, first_user_id, admin_id)
+        loader = Loader(conn)
+
+        print(f"프리셋 {args.preset} / 시드 {args.seed} / 기준일 {anchor} ({generator.start_date} ~ {generator.end_date})")
+        password_hash = get_password_hash(args.password)
+        await loader.load(User.__table__, USER_COLUMNS, generator.users(args.email_pattern, password_hash))
+        await loader.load(Notice.__table__, NOTICE_COLUMNS, generator.notices())
+        for schedules, applications in generator.schedule_batches():
+            await loader.load(Schedule.__table__, SCHEDULE_FIELDS, schedules)
+            await loader.load(Application.__table__, APPLICATION_COLUMNS, applications)
+        for notifications in generator.notification_batches():
+            await loader.load(Notification.__table__, NOTIFICATION_COLUMNS, notifications)
+
+        if loader.postgresql:
+            # id를 직접 지정했으므로 시퀀스를 최댓값 뒤로 이동
+            for table in ("users", "schedules", "applications", "notices", "notifications"):
+                await conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+                ))
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    # 조회 캐시 / ETag 버전 무효화
+    months, day = set(), generator.start_date.replace(day=1)
+    while day < generator.end_date:
+        months.add(day)
+        day = (day + timedelta(days=32)).replace(day=1)
+    await invalidate_schedule_months(*months)
+    await invalidate_templates()
+    await cache.delete(NOTICE_TOTAL_CACHE_KEY)
+    await bump_versions(NOTICES_VERSION)
+    await cache.close()
+    await engine.dispose()
+
+    print(f"적재 완료 ({time.perf_counter() - started:.1f}초)")
+    loader.report()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", help="기준일 YYYY-MM-DD (기본: 오늘, 과거 일정은 이전 / 이후 90일은 미래 일정)")
+    parser.add_argument("--reset", action="store_true", help="관리자 계정을 제외한 기존 데이터 삭제 후 생성")
+    parser.add_argument("--email-pattern", default="bench{i}@example.com", help="사용자 이메일 ({i}: 번호)")
+    parser.add_argument("--password", default="benchmark-password")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args)))
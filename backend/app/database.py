@@ -1,18 +1,75 @@
-from sqlalchemy import create_engine
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.utils.pool_stats import InstrumentedQueuePool, pool_stats
+
+
+def get_async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환 (asyncpg / aiosqlite)"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+def get_sync_database_url(url: str) -> str:
+    """비동기 드라이버 URL을 동기 드라이버 URL로 변환 (Alembic 마이그레이션용)"""
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    if url.startswith("postgresql+asyncpg://"):
+        return url.replace("postgresql+asyncpg://", "postgresql://", 1)
+    if url.startswith("sqlite+aiosqlite://"):
+        return url.replace("sqlite+aiosqlite://", "sqlite://", 1)
+    return url
+
+
+def get_engine_options(url: str) -> dict:
+    """Settings 기반 커넥션 풀 옵션 (SQLite는 드라이버 기본 풀 사용)"""
+    if url.startswith("sqlite"):
+        return {}
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    **get_engine_options(settings.DATABASE_URL),
+)
+pool_stats.attach(engine.sync_engine.pool)
+
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+def utcnow() -> datetime:
+    """
+    생성 시각 기본값 (애플리케이션에서 채움)
+
+    SQLite의 CURRENT_TIMESTAMP는 마이크로초 없이 저장되어 바인드된 datetime과
+    문자열 비교가 어긋나므로, 커서 정렬 키로 쓰는 시각은 항상 같은 형식으로 저장합니다.
+    """
+    return datetime.now(timezone.utc)
+
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,10 +1,11 @@
-from fastapi import FastAPI
+import asyncio
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.database import engine, Base, SessionLocal
-from app.models import User, Schedule, Application, Notice, Notification
-from app.models.user import UserRole, AuthProvider
+from app.database import engine
 from app.routers import (
     auth_router,
     schedules_router,
@@ -13,10 +14,11 @@ from app.routers import (
     admin_router,
     notifications_router,
 )
-from app.utils.security import get_password_hash
-
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+from app.services.cache import cache
+from app.services.event_broker import event_broker
+from app.services.push_service import push_dispatcher
+from app.services.reminder_service import run_reminder_scheduler
+from app.utils.security import PasswordHasherBusy
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -35,6 +37,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Read-Cursor", "ETag", "Last-Modified"],
 )
 
 # 라우터 등록
@@ -46,26 +49,42 @@ app.include_router(admin_router, prefix="/api")
 app.include_router(notifications_router, prefix="/api")
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """로그인 폭주로 해싱 대기열이 가득 찬 경우"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "요청이 많아 잠시 후 다시 시도해 주세요."},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 초기 관리자 계정 생성"""
-    db = SessionLocal()
-    try:
-        # 초기 관리자 계정 확인
-        admin = db.query(User).filter(User.email == settings.INITIAL_ADMIN_EMAIL).first()
-        if not admin:
-            admin = User(
-                email=settings.INITIAL_ADMIN_EMAIL,
-                password_hash=get_password_hash(settings.INITIAL_ADMIN_PASSWORD),
-                name=settings.INITIAL_ADMIN_NAME,
-                role=UserRole.ADMIN,
-                provider=AuthProvider.EMAIL,
-            )
-            db.add(admin)
-            db.commit()
-            print(f"초기 관리자 계정 생성: {settings.INITIAL_ADMIN_EMAIL}")
-    finally:
-        db.close()
+    """
+    앱 시작 시 백그라운드 작업 시작
+
+    스키마 생성과 초기 관리자 계정 생성은 배포 단계에서 한 번만 실행합니다.
+        alembic upgrade head && python -m app.commands.create_admin
+    """
+    await push_dispatcher.start()
+    await event_broker.start()
+
+    # 봉사 1일 전 리마인더 스케줄러
+    if settings.REMINDER_ENABLED:
+        app.state.reminder_task = asyncio.create_task(run_reminder_scheduler())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """앱 종료 시 스케줄러, 푸시 발송 대기열, 이벤트 구독, 커넥션 풀 및 캐시 연결 정리"""
+    reminder_task = getattr(app.state, "reminder_task", None)
+    if reminder_task:
+        reminder_task.cancel()
+    await push_dispatcher.stop()
+    await event_broker.stop()
+    await engine.dispose()
+    await cache.close()
 
 
 @app.get("/")
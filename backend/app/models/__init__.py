@@ -1,7 +1,9 @@
 from app.models.user import User
 from app.models.schedule import Schedule
+from app.models.schedule_template import ScheduleTemplate, ScheduleTemplateException
 from app.models.application import Application
 from app.models.notice import Notice
 from app.models.notification import Notification
+from app.models.job_lease import JobLease
 
-__all__ = ["User", "Schedule", "Application", "Notice", "Notification"]
+__all__ = ["User", "Schedule", "ScheduleTemplate", "ScheduleTemplateException", "Application", "Notice", "Notification", "JobLease"]
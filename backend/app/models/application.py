@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -24,6 +24,10 @@ class Application(Base):
     # Unique constraint for user_id and schedule_id
     __table_args__ = (
         UniqueConstraint("user_id", "schedule_id", name="uq_user_schedule"),
+        # 일정별 지원자 목록 / 명단 / 리마인더 / 지원자 수 보정
+        Index("ix_applications_schedule_status", "schedule_id", "status"),
+        # 내 지원 내역 (상태 필터)
+        Index("ix_applications_user_status_applied_at", "user_id", "status", "applied_at"),
     )
 
     # Relationships
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Date, DateTime
+
+from app.database import Base
+
+
+class JobLease(Base):
+    """주기 작업 실행 잠금 (여러 워커 중 하나만 실행, 하루 한 번 실행 보장)"""
+    __tablename__ = "job_leases"
+
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(255), nullable=True)
+    lease_until = Column(DateTime(timezone=True), nullable=True)
+    last_completed_on = Column(Date, nullable=True)
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class Notice(Base):
@@ -13,8 +13,13 @@ class Notice(Base):
     content = Column(Text, nullable=False)
     is_important = Column(Boolean, default=False)
     created_by = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # 중요 공지 우선 최신순 목록 / 커서 페이지네이션
+        Index("ix_notices_important_created_at_id", "is_important", "created_at", "id"),
+    )
+
     # Relationships
     author = relationship("User", back_populates="created_notices")
@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Enum, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class NotificationType(str, enum.Enum):
@@ -21,7 +21,23 @@ class Notification(Base):
     body = Column(Text, nullable=False)
     type = Column(Enum(NotificationType), default=NotificationType.SCHEDULE)
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    # 리마인더 대상 일정 / 일정 날짜 (같은 일정 리마인더 중복 방지)
+    schedule_id = Column(Integer, ForeignKey("schedules.id", ondelete="SET NULL"), nullable=True)
+    schedule_date = Column(Date, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "schedule_id", "type", "schedule_date", name="uq_notification_schedule"),
+        # 사용자별 최신순 커서 페이지네이션
+        Index("ix_notifications_user_created_at_id", "user_id", "created_at", "id"),
+        # 안 읽은 알림만 담는 부분 인덱스 (안 읽은 개수 조회용)
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = 0"),
+        ),
+    )
 
     # Relationships
     user = relationship("User", back_populates="notifications")
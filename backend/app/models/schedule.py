@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Time, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, Time, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -15,10 +15,19 @@ class Schedule(Base):
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     location = Column(String(255), nullable=True)
+    capacity = Column(Integer, nullable=True)  # 정원 (None이면 제한 없음)
+    applicant_count = Column(Integer, nullable=False, default=0, server_default="0")  # APPLIED 상태 지원 수
+    template_id = Column(Integer, ForeignKey("schedule_templates.id", ondelete="SET NULL"), nullable=True)  # 반복 일정에서 생성된 회차
     created_by = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # 같은 날짜 / 시작 시간 / 장소의 일정은 하나만 존재 (일괄 등록 upsert 기준)
+    # 장소가 없는 일정끼리도 충돌하도록 NULL을 빈 문자열로 비교
+    __table_args__ = (
+        Index("uq_schedule_slot", date, start_time, func.coalesce(location, ""), unique=True),
+    )
+
     # Relationships
     creator = relationship("User", back_populates="created_schedules")
     applications = relationship("Application", back_populates="schedule", cascade="all, delete-orphan")
@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, String, Text, Date, Time, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ScheduleTemplate(Base):
+    """
+    반복 일정 템플릿 (매주 같은 요일 / 시간 / 장소)
+
+    템플릿의 각 회차는 조회 시 계산되며, 지원하거나 관리자가 수정할 때만
+    schedules 테이블에 실제 행으로 저장됩니다.
+    """
+    __tablename__ = "schedule_templates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    weekday = Column(Integer, nullable=False)  # 0=월요일 ... 6=일요일
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    location = Column(String(255), nullable=False)
+    capacity = Column(Integer, nullable=True)
+    valid_from = Column(Date, nullable=False)
+    valid_until = Column(Date, nullable=True)  # None이면 종료일 없음
+    created_by = Column(Integer, ForeignKey("users.id"))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class ScheduleTemplateException(Base):
+    """템플릿 회차 중 생성하지 않을 날짜 (삭제 / 날짜 변경된 회차)"""
+    __tablename__ = "schedule_template_exceptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    template_id = Column(Integer, ForeignKey("schedule_templates.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("template_id", "date", name="uq_template_exception_date"),
+    )
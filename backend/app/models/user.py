@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class UserRole(str, enum.Enum):
@@ -29,9 +29,18 @@ class User(Base):
     provider = Column(Enum(AuthProvider), default=AuthProvider.EMAIL)
     provider_id = Column(String(255), nullable=True)  # for social login
     fcm_token = Column(String(500), nullable=True)  # for push notifications
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # 관리자 사용자 목록: 최신순 커서, 역할 / 가입 방식 필터, 이름 / 이메일 앞부분 검색
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_role_created_at", "role", "created_at"),
+        Index("ix_users_provider_created_at", "provider", "created_at"),
+        Index("ix_users_name_prefix", "name", postgresql_ops={"name": "varchar_pattern_ops"}),
+        Index("ix_users_email_prefix", "email", postgresql_ops={"email": "varchar_pattern_ops"}),
+    )
+
     # Relationships
     applications = relationship("Application", back_populates="user")
     created_schedules = relationship("Schedule", back_populates="creator")
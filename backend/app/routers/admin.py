@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import Select, select, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
 
-from app.database import get_db
-from app.models.user import User, UserRole
+from app.database import get_db, engine
+from app.models.user import User, UserRole, AuthProvider
 from app.schemas.user import UserCreate, UserResponse
-from app.utils.security import get_password_hash
-from app.utils.deps import get_current_admin
+from app.services.cache import cache
+from app.services.event_broker import event_broker
+from app.utils.security import Principal, hash_password_async
+from app.utils.deps import get_current_admin, invalidate_principal, principal_cache
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.pool_stats import pool_stats
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -14,12 +20,12 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 @router.post("/register", response_model=UserResponse)
 async def register_admin(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """새 관리자 등록 (관리자 전용)"""
     # 이메일 중복 체크
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,34 +35,84 @@ async def register_admin(
     # 관리자 생성
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         name=user_data.name,
         phone=user_data.phone,
         role=UserRole.ADMIN,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return UserResponse.from_orm_with_mapping(user)
 
 
+def user_list_query(
+    role: Optional[UserRole] = None,
+    provider: Optional[AuthProvider] = None,
+    q: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Select:
+    """사용자 목록 쿼리 ((created_at, id) 역순, 필터 / keyset 커서 조건 포함)"""
+    # UserResponse에 필요한 컬럼만 조회 (password_hash, fcm_token 제외)
+    query = select(
+        User.id,
+        User.email,
+        User.name,
+        User.phone,
+        User.role,
+        User.provider,
+        User.created_at,
+    ).order_by(User.created_at.desc(), User.id.desc())
+
+    if role is not None:
+        query = query.where(User.role == role)
+    if provider is not None:
+        query = query.where(User.provider == provider)
+    if q:
+        query = query.where(or_(
+            User.name.startswith(q, autoescape=True),
+            User.email.startswith(q, autoescape=True),
+        ))
+    if cursor:
+        created_at, user_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        query = query.where(tuple_(User.created_at, User.id) < tuple_(created_at, user_id))
+    return query
+
+
 @router.get("/users", response_model=List[UserResponse])
 async def get_all_users(
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    response: Response,
+    role: Optional[UserRole] = Query(None, description="역할 필터"),
+    provider: Optional[AuthProvider] = Query(None, description="가입 방식 필터"),
+    q: Optional[str] = Query(None, min_length=1, description="이름 / 이메일 앞부분 검색"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
-    """전체 사용자 목록 (관리자 전용)"""
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    return [UserResponse.from_orm_with_mapping(user) for user in users]
+    """
+    사용자 목록 (관리자 전용)
+
+    created_at, id 역순 커서 페이지네이션이며 다음 페이지 커서는
+    X-Next-Cursor 응답 헤더로 전달됩니다.
+    """
+    query = user_list_query(role, provider, q, cursor)
+    rows = (await db.execute(query.limit(limit + 1))).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return [UserResponse.from_orm_with_mapping(row) for row in rows]
 
 
 @router.put("/users/{user_id}/role")
 async def update_user_role(
     user_id: int,
     role: str,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """사용자 역할 변경 (관리자 전용)"""
     if role not in ["admin", "user"]:
@@ -65,7 +121,7 @@ async def update_user_role(
             detail="유효하지 않은 역할입니다. (admin 또는 user)",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,6 +136,35 @@ async def update_user_role(
         )
 
     user.role = UserRole.ADMIN if role == "admin" else UserRole.USER
-    db.commit()
+    await db.commit()
+    # 관리자 권한은 인증 사용자 캐시 / DB로 확인하므로 캐시만 비우면 반영됨
+    await invalidate_principal(user.id)
 
     return {"message": f"사용자 역할이 {role}로 변경되었습니다."}
+
+
+@router.get("/pool-stats")
+async def get_pool_stats(
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """데이터베이스 커넥션 풀 상태 (관리자 전용)"""
+    return pool_stats.snapshot(engine.sync_engine.pool)
+
+
+@router.get("/event-stats")
+async def get_event_stats(
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """실시간 이벤트 구독자 / 버려진 이벤트 통계 (관리자 전용, 현재 워커 기준)"""
+    return event_broker.stats()
+
+
+@router.get("/cache-stats")
+async def get_cache_stats(
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """캐시 hit / miss 통계 (관리자 전용)"""
+    return {
+        "data": cache.stats(),
+        "principal": principal_cache.stats(),
+    }
@@ -1,40 +1,250 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Select, and_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import Dict, List, Literal, Optional, Union
+from datetime import date, datetime, time, timedelta
 
 from app.database import get_db
 from app.models.user import User
 from app.models.schedule import Schedule
 from app.models.application import Application, ApplicationStatus
-from app.schemas.application import ApplicationResponse
+from app.schemas.application import ApplicationResponse, CompactScheduleRoster, ScheduleRosterResponse
+from app.services.schedule_service import (
+    SCHEDULE_COLUMNS,
+    get_schedule_by_id,
+    get_virtual_occurrence,
+    invalidate_schedule_months,
+    materialize_occurrence,
+    release_seat,
+    reserve_seat,
+)
+from app.services.event_broker import publish_seat_change
+from app.services.reminder_service import KST
+from app.utils.security import Principal
 from app.utils.deps import get_current_user, get_current_admin
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.serialization import application_item, fast_json_response, schedule_item
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 
+async def _get_application_with_schedule(db: AsyncSession, application_id: int) -> Application:
+    """일정 정보를 함께 로드한 지원 내역 조회"""
+    return await db.scalar(
+        select(Application)
+        .options(selectinload(Application.schedule))
+        .where(Application.id == application_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+def my_applications_query(
+    user_id: int,
+    scope: str,
+    today: date,
+    status_filter: Optional[ApplicationStatus] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+) -> Select:
+    """내 지원 내역 쿼리 (일정 조인, keyset 커서 조건 / 정렬 포함, LIMIT 제외)"""
+    query = (
+        select(
+            Application.id.label("application_id"),
+            Application.user_id,
+            Application.schedule_id,
+            Application.status,
+            Application.applied_at,
+            Application.cancelled_at,
+            *SCHEDULE_COLUMNS,
+        )
+        .join(Schedule, Schedule.id == Application.schedule_id)
+        .where(Application.user_id == user_id)
+    )
+
+    if scope == "upcoming":
+        query = query.where(Schedule.date >= today)
+    elif scope == "past":
+        query = query.where(Schedule.date < today)
+    if status_filter is not None:
+        query = query.where(Application.status == status_filter)
+    if date_from is not None:
+        query = query.where(Schedule.date >= date_from)
+    if date_to is not None:
+        query = query.where(Schedule.date <= date_to)
+
+    # (일정 날짜, 시작 시간, 지원 ID) 기준 keyset 페이지네이션
+    sort_key = tuple_(Schedule.date, Schedule.start_time, Application.id)
+    ascending = scope == "upcoming"
+    if cursor:
+        cursor_key = tuple_(*decode_cursor(cursor, date.fromisoformat, time.fromisoformat, int))
+        query = query.where(sort_key > cursor_key if ascending else sort_key < cursor_key)
+
+    if ascending:
+        return query.order_by(Schedule.date, Schedule.start_time, Application.id)
+    return query.order_by(Schedule.date.desc(), Schedule.start_time.desc(), Application.id.desc())
+
+
 @router.get("/my", response_model=List[ApplicationResponse])
 async def get_my_applications(
-    db: Session = Depends(get_db),
+    response: Response,
+    scope: Literal["upcoming", "past", "all"] = Query("upcoming", description="upcoming: 오늘 이후 / past: 지난 일정 / all: 전체"),
+    status_filter: Optional[ApplicationStatus] = Query(None, alias="status", description="지원 상태 필터"),
+    dateFrom: Optional[date] = Query(None, description="일정 시작일 (포함)"),
+    dateTo: Optional[date] = Query(None, description="일정 종료일 (포함)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """내 지원 내역 조회"""
-    applications = db.query(Application).filter(
-        Application.user_id == current_user.id,
-    ).order_by(Application.applied_at.desc()).all()
+    """
+    내 지원 내역 조회
+
+    일정과 한 번에 조인하여 조회합니다. upcoming은 일정 날짜 / 시간순,
+    past와 all은 최신 일정부터 정렬되며 다음 페이지 커서는 X-Next-Cursor
+    응답 헤더로 전달됩니다.
+    """
+    query = my_applications_query(
+        current_user.id,
+        scope,
+        datetime.now(KST).date(),
+        status_filter=status_filter,
+        date_from=dateFrom,
+        date_to=dateTo,
+        cursor=cursor,
+    )
+
+    rows = (await db.execute(query.limit(limit + 1))).all()
 
-    return [ApplicationResponse.from_orm_with_mapping(app, include_schedule=True) for app in applications]
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.date, last.start_time, last.application_id)
+
+    return fast_json_response([application_item(row, schedule_item(row)) for row in rows], response)
+
+
+ROSTER_MAX_DAYS = 62
+ROSTER_MAX_SCHEDULES = 200
+
+
+def roster_query(schedule_filter) -> Select:
+    """일정 / 지원(APPLIED) / 사용자 조인 명단 쿼리 (지원자가 없는 일정 포함)"""
+    return (
+        select(
+            *SCHEDULE_COLUMNS,
+            Application.id.label("application_id"),
+            Application.user_id,
+            Application.schedule_id,
+            Application.status,
+            Application.applied_at,
+            Application.cancelled_at,
+            User.email.label("user_email"),
+            User.name.label("user_name"),
+            User.phone.label("user_phone"),
+            User.role.label("user_role"),
+            User.provider.label("user_provider"),
+            User.created_at.label("user_created_at"),
+        )
+        .select_from(Schedule)
+        .outerjoin(Application, and_(
+            Application.schedule_id == Schedule.id,
+            Application.status == ApplicationStatus.APPLIED,
+        ))
+        .outerjoin(User, User.id == Application.user_id)
+        .where(schedule_filter)
+        .order_by(Schedule.date, Schedule.start_time, Schedule.id, Application.applied_at)
+    )
+
+
+def schedule_applicants_query(schedule_id: int) -> Select:
+    """일정의 지원자(APPLIED) 쿼리 (사용자 함께 로드)"""
+    return (
+        select(Application)
+        .options(selectinload(Application.user))
+        .where(
+            Application.schedule_id == schedule_id,
+            Application.status == ApplicationStatus.APPLIED,
+        )
+    )
+
+
+@router.get("/rosters", response_model=Union[List[ScheduleRosterResponse], List[CompactScheduleRoster]])
+async def get_schedule_rosters(
+    dateFrom: Optional[date] = Query(None, description="일정 시작일 (포함)"),
+    dateTo: Optional[date] = Query(None, description="일정 종료일 (포함)"),
+    scheduleIds: Optional[List[int]] = Query(None, description="일정 ID 목록"),
+    compact: bool = Query(False, description="일정 ID / 제목과 지원자 ID / 이름만 반환"),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    여러 일정의 지원자 명단 (관리자 전용)
+
+    기간(dateFrom ~ dateTo) 또는 일정 ID 목록으로 조회하며, 일정 / 지원 / 사용자를
+    한 번에 조인한 뒤 일정별로 묶어 반환합니다. 지원자가 없는 일정도 포함됩니다.
+    """
+    if scheduleIds:
+        if len(scheduleIds) > ROSTER_MAX_SCHEDULES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"일정은 최대 {ROSTER_MAX_SCHEDULES}개까지 조회할 수 있습니다.",
+            )
+        schedule_filter = Schedule.id.in_(scheduleIds)
+    elif dateFrom is not None and dateTo is not None:
+        if dateTo < dateFrom or dateTo - dateFrom > timedelta(days=ROSTER_MAX_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"조회 기간은 시작일 이후 최대 {ROSTER_MAX_DAYS}일입니다.",
+            )
+        schedule_filter = and_(Schedule.date >= dateFrom, Schedule.date <= dateTo)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="dateFrom과 dateTo 또는 scheduleIds를 지정해야 합니다.",
+        )
+
+    rows = (await db.execute(roster_query(schedule_filter))).all()
+
+    rosters: Dict[int, dict] = {}
+    for row in rows:
+        roster = rosters.get(row.id)
+        if roster is None:
+            if compact:
+                roster = {"scheduleId": row.id, "title": row.title, "applicants": []}
+            else:
+                roster = {"schedule": schedule_item(row), "applicants": []}
+            rosters[row.id] = roster
+
+        if row.application_id is None:
+            continue
+        if compact:
+            roster["applicants"].append({"userId": row.user_id, "name": row.user_name})
+        else:
+            roster["applicants"].append(application_item(row, user={
+                "id": row.user_id,
+                "email": row.user_email,
+                "name": row.user_name,
+                "phone": row.user_phone,
+                "role": row.user_role,
+                "provider": row.user_provider,
+                "createdAt": row.user_created_at,
+            }))
+
+    return fast_json_response(list(rosters.values()))
 
 
 @router.post("/{schedule_id}", response_model=ApplicationResponse)
 async def apply_for_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """봉사 일정 지원"""
+    """봉사 일정 지원 (반복 일정 회차는 이때 저장됨)"""
     # 일정 존재 확인
-    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    schedule = await materialize_occurrence(db, schedule_id)
     if not schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,34 +252,72 @@ async def apply_for_schedule(
         )
 
     # 기존 지원 내역 확인
-    existing_application = db.query(Application).filter(
-        Application.user_id == current_user.id,
-        Application.schedule_id == schedule_id,
-    ).first()
+    existing_application = await db.scalar(
+        select(Application).where(
+            Application.user_id == current_user.id,
+            Application.schedule_id == schedule.id,
+        )
+    )
+
+    if existing_application and existing_application.status == ApplicationStatus.APPLIED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 지원한 일정입니다.",
+        )
+
+    # 정원 내에서 좌석 예약 (조건부 UPDATE로 초과 신청 방지)
+    applicant_count = await reserve_seat(db, schedule.id)
+    if applicant_count is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="정원이 마감된 일정입니다.",
+        )
 
     if existing_application:
-        if existing_application.status == ApplicationStatus.APPLIED:
+        # 취소된 지원을 다시 활성화 (동시 요청 시 한 번만 반영)
+        result = await db.execute(
+            update(Application).where(
+                Application.id == existing_application.id,
+                Application.status == ApplicationStatus.CANCELLED,
+            ).values(status=ApplicationStatus.APPLIED, cancelled_at=None)
+        )
+        if result.rowcount != 1:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이미 지원한 일정입니다.",
             )
-        else:
-            # 취소된 지원을 다시 활성화
-            existing_application.status = ApplicationStatus.APPLIED
-            existing_application.cancelled_at = None
-            db.commit()
-            db.refresh(existing_application)
-            return ApplicationResponse.from_orm_with_mapping(existing_application, include_schedule=True)
-
-    # 새 지원 생성
-    application = Application(
-        user_id=current_user.id,
-        schedule_id=schedule_id,
-        status=ApplicationStatus.APPLIED,
+        application_id = existing_application.id
+    else:
+        # 새 지원 생성
+        application = Application(
+            user_id=current_user.id,
+            schedule_id=schedule.id,
+            status=ApplicationStatus.APPLIED,
+        )
+        db.add(application)
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 지원한 일정입니다.",
+            )
+        application_id = application.id
+
+    await db.commit()
+    await invalidate_schedule_months(schedule.date)
+    await publish_seat_change(
+        schedule.id,
+        schedule.date,
+        applicant_count,
+        schedule.capacity,
+        delta=1,
+        occurrence_id=schedule_id if schedule_id != schedule.id else None,
     )
-    db.add(application)
-    db.commit()
-    db.refresh(application)
+    application = await _get_application_with_schedule(db, application_id)
 
     return ApplicationResponse.from_orm_with_mapping(application, include_schedule=True)
 
@@ -77,15 +325,20 @@ async def apply_for_schedule(
 @router.delete("/{schedule_id}")
 async def cancel_application(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """지원 취소"""
-    application = db.query(Application).filter(
-        Application.user_id == current_user.id,
-        Application.schedule_id == schedule_id,
-        Application.status == ApplicationStatus.APPLIED,
-    ).first()
+    schedule = await get_schedule_by_id(db, schedule_id)
+    application = None
+    if schedule:
+        application = await db.scalar(
+            select(Application).where(
+                Application.user_id == current_user.id,
+                Application.schedule_id == schedule.id,
+                Application.status == ApplicationStatus.APPLIED,
+            )
+        )
 
     if not application:
         raise HTTPException(
@@ -93,9 +346,25 @@ async def cancel_application(
             detail="지원 내역을 찾을 수 없습니다.",
         )
 
-    application.status = ApplicationStatus.CANCELLED
-    application.cancelled_at = datetime.utcnow()
-    db.commit()
+    # 동시 취소 요청 시 좌석이 한 번만 반환되도록 조건부 UPDATE
+    result = await db.execute(
+        update(Application).where(
+            Application.id == application.id,
+            Application.status == ApplicationStatus.APPLIED,
+        ).values(status=ApplicationStatus.CANCELLED, cancelled_at=datetime.utcnow())
+    )
+    if result.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="지원 내역을 찾을 수 없습니다.",
+        )
+
+    applicant_count = await release_seat(db, schedule.id)
+    await db.commit()
+    await invalidate_schedule_months(schedule.date)
+    if applicant_count is not None:
+        await publish_seat_change(schedule.id, schedule.date, applicant_count, schedule.capacity, delta=-1)
 
     return {"message": "지원이 취소되었습니다."}
 
@@ -103,20 +372,21 @@ async def cancel_application(
 @router.get("/schedule/{schedule_id}", response_model=List[ApplicationResponse])
 async def get_schedule_applicants(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """특정 일정의 지원자 목록 (관리자 전용)"""
-    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
+        # 아직 저장되지 않은 반복 일정 회차는 지원자가 없음
+        if await get_virtual_occurrence(db, schedule_id):
+            return []
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="일정을 찾을 수 없습니다.",
         )
 
-    applications = db.query(Application).filter(
-        Application.schedule_id == schedule_id,
-        Application.status == ApplicationStatus.APPLIED,
-    ).all()
+    result = await db.scalars(schedule_applicants_query(schedule.id))
+    applications = result.all()
 
     return [ApplicationResponse.from_orm_with_mapping(app, include_schedule=False, include_user=True) for app in applications]
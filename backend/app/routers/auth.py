@@ -1,28 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import httpx
 
 from app.database import get_db
 from app.models.user import User, UserRole, AuthProvider
 from app.schemas.user import UserCreate, UserLogin, UserResponse, UserUpdate, Token
 from app.utils.security import (
-    get_password_hash,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token,
     verify_refresh_token,
 )
-from app.utils.deps import get_current_user
+from app.utils.deps import get_current_user, invalidate_principal
 from app.config import settings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=Token)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """회원가입"""
     # 이메일 중복 체크
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -32,18 +33,18 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     # 사용자 생성
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         name=user_data.name,
         phone=user_data.phone,
         role=UserRole.USER,
         provider=AuthProvider.EMAIL,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     # 토큰 생성
-    access_token = create_access_token(user.id)
+    access_token = create_access_token(user.id, role=user.role, name=user.name)
     refresh_token = create_refresh_token(user.id)
 
     return Token(
@@ -54,9 +55,9 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """로그인"""
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = await db.scalar(select(User).where(User.email == user_data.email))
 
     if not user or not user.password_hash:
         raise HTTPException(
@@ -64,14 +65,21 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
         )
 
-    if not verify_password(user_data.password, user.password_hash):
+    verified, new_hash = await verify_and_update_password(user_data.password, user.password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
         )
 
+    # 해싱 비용 설정이 바뀐 경우 새 설정으로 재해싱
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+        await invalidate_principal(user.id)
+
     # 토큰 생성
-    access_token = create_access_token(user.id)
+    access_token = create_access_token(user.id, role=user.role, name=user.name)
     refresh_token = create_refresh_token(user.id)
 
     return Token(
@@ -82,7 +90,7 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh")
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_db)):
     """토큰 갱신"""
     user_id = verify_refresh_token(refresh_token)
     if user_id is None:
@@ -91,14 +99,14 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
             detail="유효하지 않은 리프레시 토큰입니다.",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자를 찾을 수 없습니다.",
         )
 
-    new_access_token = create_access_token(user.id)
+    new_access_token = create_access_token(user.id, role=user.role, name=user.name)
     new_refresh_token = create_refresh_token(user.id)
 
     return {
@@ -117,18 +125,20 @@ async def get_me(current_user: User = Depends(get_current_user)):
 async def update_me(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """현재 사용자 정보 수정"""
+    user = await db.get(User, current_user.id)
     if user_data.name is not None:
-        current_user.name = user_data.name
+        user.name = user_data.name
     if user_data.phone is not None:
-        current_user.phone = user_data.phone
+        user.phone = user_data.phone
 
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(user)
+    await invalidate_principal(user.id)
 
-    return UserResponse.from_orm_with_mapping(current_user)
+    return UserResponse.from_orm_with_mapping(user)
 
 
 @router.post("/logout")
@@ -153,7 +163,7 @@ async def google_login():
 
 
 @router.post("/social/google/callback", response_model=Token)
-async def google_callback(code: str, db: Session = Depends(get_db)):
+async def google_callback(code: str, db: AsyncSession = Depends(get_db)):
     """Google OAuth 콜백"""
     # 액세스 토큰 요청
     async with httpx.AsyncClient() as client:
@@ -192,14 +202,16 @@ async def google_callback(code: str, db: Session = Depends(get_db)):
         user_info = user_response.json()
 
     # 사용자 조회 또는 생성
-    user = db.query(User).filter(
-        User.provider == AuthProvider.GOOGLE,
-        User.provider_id == user_info["id"],
-    ).first()
+    user = await db.scalar(
+        select(User).where(
+            User.provider == AuthProvider.GOOGLE,
+            User.provider_id == user_info["id"],
+        )
+    )
 
     if not user:
         # 이메일로 기존 사용자 확인
-        existing_user = db.query(User).filter(User.email == user_info["email"]).first()
+        existing_user = await db.scalar(select(User).where(User.email == user_info["email"]))
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -214,11 +226,11 @@ async def google_callback(code: str, db: Session = Depends(get_db)):
             provider_id=user_info["id"],
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
     # 토큰 생성
-    access_token = create_access_token(user.id)
+    access_token = create_access_token(user.id, role=user.role, name=user.name)
     refresh_token = create_refresh_token(user.id)
 
     return Token(
@@ -242,7 +254,7 @@ async def kakao_login():
 
 
 @router.post("/social/kakao/callback", response_model=Token)
-async def kakao_callback(code: str, db: Session = Depends(get_db)):
+async def kakao_callback(code: str, db: AsyncSession = Depends(get_db)):
     """Kakao OAuth 콜백"""
     async with httpx.AsyncClient() as client:
         # 액세스 토큰 요청
@@ -288,14 +300,16 @@ async def kakao_callback(code: str, db: Session = Depends(get_db)):
     nickname = profile.get("nickname", f"kakao_{kakao_id}")
 
     # 사용자 조회 또는 생성
-    user = db.query(User).filter(
-        User.provider == AuthProvider.KAKAO,
-        User.provider_id == kakao_id,
-    ).first()
+    user = await db.scalar(
+        select(User).where(
+            User.provider == AuthProvider.KAKAO,
+            User.provider_id == kakao_id,
+        )
+    )
 
     if not user:
         if email:
-            existing_user = db.query(User).filter(User.email == email).first()
+            existing_user = await db.scalar(select(User).where(User.email == email))
             if existing_user:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -310,11 +324,11 @@ async def kakao_callback(code: str, db: Session = Depends(get_db)):
             provider_id=kakao_id,
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
     # 토큰 생성
-    access_token = create_access_token(user.id)
+    access_token = create_access_token(user.id, role=user.role, name=user.name)
     refresh_token = create_refresh_token(user.id)
 
     return Token(
@@ -1,50 +1,125 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
+from datetime import datetime
 import math
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User
 from app.models.notice import Notice
 from app.schemas.notice import NoticeCreate, NoticeUpdate, NoticeResponse, PaginatedNoticeResponse
+from app.services.cache import cache
+from app.utils.http_cache import bump_versions, conditional_get
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.serialization import fast_json_response, notice_item
+from app.utils.security import Principal
 from app.utils.deps import get_current_user, get_current_admin
 
 router = APIRouter(prefix="/notices", tags=["notices"])
 
 
+NOTICE_TOTAL_CACHE_KEY = "notices:total"
+NOTICES_VERSION = "notices"
+
+
+async def _get_notice_total(db: AsyncSession) -> int:
+    """공지사항 전체 개수 (캐시, 작성 / 삭제 시 무효화)"""
+    total = await cache.get(NOTICE_TOTAL_CACHE_KEY)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(Notice))
+        await cache.set(NOTICE_TOTAL_CACHE_KEY, total, ttl=settings.NOTICE_TOTAL_TTL_SECONDS)
+    return total
+
+
+def notice_list_query(cursor: Optional[str] = None) -> Select:
+    """공지사항 목록 쿼리 (중요 공지 우선 최신순, 커서 지정 시 keyset 조건 포함)"""
+    query = select(
+        Notice.id,
+        Notice.title,
+        Notice.content,
+        Notice.is_important,
+        Notice.created_by,
+        Notice.created_at,
+        Notice.updated_at,
+    ).order_by(
+        Notice.is_important.desc(),
+        Notice.created_at.desc(),
+        Notice.id.desc(),
+    )
+    if cursor:
+        # (is_important, created_at, id) 기준 keyset 조회 - OFFSET 없이 다음 페이지 접근
+        is_important, created_at, notice_id = decode_cursor(
+            cursor, bool, datetime.fromisoformat, int,
+        )
+        query = query.where(
+            tuple_(Notice.is_important, Notice.created_at, Notice.id)
+            < tuple_(is_important, created_at, notice_id)
+        )
+    return query
+
+
 @router.get("", response_model=PaginatedNoticeResponse)
 async def get_notices(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     pageSize: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """공지사항 목록 조회"""
-    total = db.query(Notice).count()
+    """공지사항 목록 조회 (page 또는 cursor 방식, If-None-Match가 최신이면 304)"""
+    not_modified = await conditional_get(request, response, [NOTICES_VERSION])
+    if not_modified:
+        return not_modified
+
+    total = await _get_notice_total(db)
     total_pages = math.ceil(total / pageSize) if total > 0 else 1
 
-    notices = db.query(Notice).order_by(
-        Notice.is_important.desc(),
-        Notice.created_at.desc(),
-    ).offset((page - 1) * pageSize).limit(pageSize).all()
-
-    return PaginatedNoticeResponse(
-        items=[NoticeResponse.from_orm_with_mapping(notice) for notice in notices],
-        total=total,
-        page=page,
-        pageSize=pageSize,
-        totalPages=total_pages,
-    )
+    query = notice_list_query(cursor)
+    if not cursor:
+        query = query.offset((page - 1) * pageSize)
+
+    result = await db.execute(query.limit(pageSize + 1))
+    notices = result.all()
+
+    next_cursor = None
+    if len(notices) > pageSize:
+        notices = notices[:pageSize]
+        last = notices[-1]
+        next_cursor = encode_cursor(last.is_important, last.created_at, last.id)
+
+    return fast_json_response({
+        "items": [notice_item(notice) for notice in notices],
+        "total": total,
+        "page": page,
+        "pageSize": pageSize,
+        "totalPages": total_pages,
+        "nextCursor": next_cursor,
+    }, response)
 
 
 @router.get("/{notice_id}", response_model=NoticeResponse)
 async def get_notice(
+    request: Request,
+    response: Response,
     notice_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """공지사항 상세 조회"""
-    notice = db.query(Notice).filter(Notice.id == notice_id).first()
+    """공지사항 상세 조회 (If-None-Match가 최신이면 304)"""
+    not_modified = await conditional_get(request, response, [NOTICES_VERSION])
+    if not_modified:
+        return not_modified
+
+    notice = await db.scalar(
+        select(Notice)
+        .options(selectinload(Notice.author))
+        .where(Notice.id == notice_id)
+    )
     if not notice:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -57,19 +132,21 @@ async def get_notice(
 @router.post("", response_model=NoticeResponse)
 async def create_notice(
     notice_data: NoticeCreate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """공지사항 작성 (관리자 전용)"""
     notice = Notice(
         title=notice_data.title,
         content=notice_data.content,
-        is_important=notice_data.isImportant,
+        is_important=bool(notice_data.isImportant),
         created_by=current_admin.id,
     )
     db.add(notice)
-    db.commit()
-    db.refresh(notice)
+    await db.commit()
+    await db.refresh(notice)
+    await cache.delete(NOTICE_TOTAL_CACHE_KEY)
+    await bump_versions(NOTICES_VERSION)
 
     return NoticeResponse.from_orm_with_mapping(notice)
 
@@ -78,11 +155,11 @@ async def create_notice(
 async def update_notice(
     notice_id: int,
     notice_data: NoticeUpdate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """공지사항 수정 (관리자 전용)"""
-    notice = db.query(Notice).filter(Notice.id == notice_id).first()
+    notice = await db.get(Notice, notice_id)
     if not notice:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -96,8 +173,9 @@ async def update_notice(
     if notice_data.isImportant is not None:
         notice.is_important = notice_data.isImportant
 
-    db.commit()
-    db.refresh(notice)
+    await db.commit()
+    await db.refresh(notice)
+    await bump_versions(NOTICES_VERSION)
 
     return NoticeResponse.from_orm_with_mapping(notice)
 
@@ -105,18 +183,20 @@ async def update_notice(
 @router.delete("/{notice_id}")
 async def delete_notice(
     notice_id: int,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """공지사항 삭제 (관리자 전용)"""
-    notice = db.query(Notice).filter(Notice.id == notice_id).first()
+    notice = await db.get(Notice, notice_id)
     if not notice:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="공지사항을 찾을 수 없습니다.",
         )
 
-    db.delete(notice)
-    db.commit()
+    await db.delete(notice)
+    await db.commit()
+    await cache.delete(NOTICE_TOTAL_CACHE_KEY)
+    await bump_versions(NOTICES_VERSION)
 
     return {"message": "공지사항이 삭제되었습니다."}
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Select, Update, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
 from pydantic import BaseModel
 
 from app.database import get_db
 from app.models.user import User
 from app.models.notification import Notification
 from app.schemas.notification import NotificationResponse
-from app.utils.deps import get_current_user
+from app.utils.deps import get_current_user, invalidate_principal
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.serialization import fast_json_response, notification_item
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -19,63 +23,138 @@ class FcmTokenRequest(BaseModel):
 @router.post("/register-token")
 async def register_fcm_token(
     request: FcmTokenRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """FCM 토큰 등록"""
-    current_user.fcm_token = request.token
-    db.commit()
+    await db.execute(
+        update(User).where(User.id == current_user.id).values(fcm_token=request.token)
+    )
+    await db.commit()
+    await invalidate_principal(current_user.id)
 
     return {"message": "FCM 토큰이 등록되었습니다."}
 
 
+def notification_list_query(user_id: int, cursor: Optional[str] = None) -> Select:
+    """알림 목록 쿼리 ((created_at, id) 역순, 커서 지정 시 keyset 조건 포함)"""
+    query = select(
+        Notification.id,
+        Notification.user_id,
+        Notification.title,
+        Notification.body,
+        Notification.type,
+        Notification.is_read,
+        Notification.created_at,
+    ).where(
+        Notification.user_id == user_id,
+    ).order_by(Notification.created_at.desc(), Notification.id.desc())
+
+    if cursor:
+        created_at, notification_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        query = query.where(
+            tuple_(Notification.created_at, Notification.id) < tuple_(created_at, notification_id)
+        )
+    return query
+
+
+def unread_count_query(user_id: int) -> Select:
+    """안 읽은 알림 개수 쿼리"""
+    return select(func.count()).select_from(Notification).where(
+        Notification.user_id == user_id,
+        Notification.is_read == False,
+    )
+
+
+def read_all_statement(user_id: int, cursor: Optional[str] = None) -> Update:
+    """모든 알림 읽음 처리 UPDATE (커서 지정 시 그 알림과 이전 알림만)"""
+    query = update(Notification).where(
+        Notification.user_id == user_id,
+        Notification.is_read == False,
+    )
+    if cursor:
+        created_at, notification_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        query = query.where(
+            tuple_(Notification.created_at, Notification.id) <= tuple_(created_at, notification_id)
+        )
+    return query.values(is_read=True).execution_options(synchronize_session=False)
+
+
 @router.get("", response_model=List[NotificationResponse])
 async def get_notifications(
-    db: Session = Depends(get_db),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """알림 내역 조회"""
-    notifications = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-    ).order_by(Notification.created_at.desc()).limit(50).all()
+    """
+    알림 내역 조회
 
-    return [NotificationResponse.from_orm_with_mapping(notif) for notif in notifications]
+    (created_at, id) 역순 커서 페이지네이션이며 다음 페이지 커서는 X-Next-Cursor,
+    첫 페이지의 가장 최근 알림 커서는 X-Read-Cursor 응답 헤더로 전달됩니다.
+    X-Read-Cursor는 read-all의 cursor로 사용할 수 있습니다.
+    """
+    query = notification_list_query(current_user.id, cursor)
+    rows = (await db.execute(query.limit(limit + 1))).all()
+
+    if not cursor and rows:
+        response.headers["X-Read-Cursor"] = encode_cursor(rows[0].created_at, rows[0].id)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return fast_json_response([notification_item(row) for row in rows], response)
+
+
+@router.get("/unread-count")
+async def get_unread_count(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """안 읽은 알림 개수 (부분 인덱스만 사용)"""
+    count = await db.scalar(unread_count_query(current_user.id))
+
+    return {"count": count}
 
 
 @router.put("/{notification_id}/read")
 async def mark_as_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """알림 읽음 처리"""
-    notification = db.query(Notification).filter(
-        Notification.id == notification_id,
-        Notification.user_id == current_user.id,
-    ).first()
-
-    if not notification:
+    result = await db.execute(
+        update(Notification).where(
+            Notification.id == notification_id,
+            Notification.user_id == current_user.id,
+        ).values(is_read=True)
+    )
+
+    if result.rowcount != 1:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="알림을 찾을 수 없습니다.",
         )
 
-    notification.is_read = True
-    db.commit()
+    await db.commit()
 
     return {"message": "알림이 읽음 처리되었습니다."}
 
 
 @router.put("/read-all")
 async def mark_all_as_read(
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이 커서의 알림과 그 이전 알림만 읽음 처리 (X-Read-Cursor)"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """모든 알림 읽음 처리"""
-    db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False,
-    ).update({"is_read": True})
-    db.commit()
+    """
+    모든 알림 읽음 처리 (UPDATE 1회)
+
+    cursor를 지정하면 목록을 받은 이후 도착한 알림은 읽지 않은 상태로 남습니다.
+    """
+    await db.execute(read_all_statement(current_user.id, cursor))
+    await db.commit()
 
     return {"message": "모든 알림이 읽음 처리되었습니다."}
@@ -1,72 +1,117 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
-from datetime import datetime, date, time
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from datetime import datetime, date, time, timedelta
+import asyncio
 
 from app.database import get_db
 from app.models.user import User
 from app.models.schedule import Schedule
-from app.models.application import Application, ApplicationStatus
-from app.schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleResponse
-from app.utils.deps import get_current_user, get_current_admin, get_current_user_optional
+from app.models.schedule_template import ScheduleTemplate, ScheduleTemplateException
+from app.schemas.schedule import (
+    ScheduleCreate,
+    ScheduleUpdate,
+    ScheduleResponse,
+    ScheduleBulkRequest,
+    ScheduleBulkResponse,
+    ScheduleTemplateCreate,
+    ScheduleTemplateUpdate,
+    ScheduleTemplateResponse,
+)
+from app.services.schedule_service import (
+    add_template_exception,
+    build_schedule_responses,
+    bulk_upsert_schedules,
+    clone_schedules,
+    get_day_schedules,
+    get_month_schedules,
+    get_schedule_by_id,
+    get_virtual_occurrence,
+    invalidate_schedule_months,
+    materialize_occurrence,
+    month_cache_key,
+    plan_clone,
+)
+from app.config import settings
+from app.services.event_broker import event_broker, month_topic, publish_schedule_change
+from app.services.template_service import TEMPLATES_CACHE_KEY, invalidate_templates
+from app.utils.http_cache import conditional_get
+from app.utils.serialization import dumps, fast_json_response
+from app.utils.security import Principal
+from app.utils.deps import get_current_admin, get_current_user_optional
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
+SLOT_TAKEN_DETAIL = "같은 날짜 / 시간 / 장소에 이미 일정이 있습니다."
+CAPACITY_BELOW_APPLICANTS_DETAIL = "정원은 현재 지원자 수보다 적을 수 없습니다."
+
+
+def _parse_time(value: str) -> time:
+    """HH:MM 시간 파싱 (형식이 잘못되면 400)"""
+    try:
+        return datetime.strptime(value, "%H:%M").time()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시간 형식이 올바르지 않습니다. (HH:MM)",
+        )
+
+
+def _parse_schedule_times(schedule_data: Union[ScheduleCreate, ScheduleTemplateCreate]) -> tuple:
+    """시작 / 종료 시간 파싱 및 정원 검증"""
+    start_time = _parse_time(schedule_data.startTime)
+    end_time = _parse_time(schedule_data.endTime)
+
+    if start_time >= end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료 시간은 시작 시간 이후여야 합니다.",
+        )
+
+    if schedule_data.capacity is not None and schedule_data.capacity < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="정원은 1명 이상이어야 합니다.",
+        )
+
+    return start_time, end_time
+
 
 @router.get("", response_model=List[ScheduleResponse])
 async def get_schedules(
+    request: Request,
+    response: Response,
     year: int = Query(..., description="연도"),
     month: int = Query(..., ge=1, le=12, description="월"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """월별 일정 목록 조회"""
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1)
-    else:
-        end_date = date(year, month + 1, 1)
-
-    schedules = db.query(Schedule).filter(
-        Schedule.date >= start_date,
-        Schedule.date < end_date,
-    ).order_by(Schedule.date, Schedule.start_time).all()
-
-    result = []
-    for schedule in schedules:
-        # 지원자 수 계산
-        applicant_count = db.query(func.count(Application.id)).filter(
-            Application.schedule_id == schedule.id,
-            Application.status == ApplicationStatus.APPLIED,
-        ).scalar()
-
-        # 현재 사용자 지원 여부
-        is_applied = False
-        if current_user:
-            application = db.query(Application).filter(
-                Application.user_id == current_user.id,
-                Application.schedule_id == schedule.id,
-                Application.status == ApplicationStatus.APPLIED,
-            ).first()
-            is_applied = application is not None
-
-        result.append(ScheduleResponse.from_orm_with_mapping(
-            schedule,
-            applicant_count=applicant_count,
-            is_applied=is_applied,
-        ))
-
-    return result
+    """월별 일정 목록 조회 (If-None-Match가 최신이면 304)"""
+    not_modified = await conditional_get(
+        request,
+        response,
+        [month_cache_key(year, month), TEMPLATES_CACHE_KEY],
+        current_user.id if current_user else "anonymous",
+    )
+    if not_modified:
+        return not_modified
+
+    items = await get_month_schedules(db, year, month, current_user)
+    return fast_json_response(items, response)
 
 
 @router.get("/by-date", response_model=List[ScheduleResponse])
 async def get_schedules_by_date(
+    request: Request,
+    response: Response,
     date_str: str = Query(..., alias="date", description="날짜 (YYYY-MM-DD)"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """특정 날짜의 일정 조회"""
+    """특정 날짜의 일정 조회 (If-None-Match가 최신이면 304)"""
     try:
         target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError:
@@ -75,91 +120,216 @@ async def get_schedules_by_date(
             detail="날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)",
         )
 
-    schedules = db.query(Schedule).filter(
-        Schedule.date == target_date,
-    ).order_by(Schedule.start_time).all()
+    not_modified = await conditional_get(
+        request,
+        response,
+        [month_cache_key(target_date.year, target_date.month), TEMPLATES_CACHE_KEY],
+        target_date.isoformat(),
+        current_user.id if current_user else "anonymous",
+    )
+    if not_modified:
+        return not_modified
+
+    items = await get_day_schedules(db, target_date, current_user)
+    return fast_json_response(items, response)
+
+
+@router.get("/stream")
+async def stream_schedule_events(
+    request: Request,
+    year: int = Query(..., description="연도"),
+    month: int = Query(..., ge=1, le=12, description="월"),
+):
+    """
+    월별 일정 실시간 이벤트 (Server-Sent Events)
+
+    - seats: 지원 / 취소로 인한 지원자 수 변동 (scheduleId, applicantCount, capacity, delta)
+    - schedule: 일정 생성 / 수정 / 삭제 (해당 월을 다시 조회)
+
+    이벤트가 없을 때는 EVENT_HEARTBEAT_SECONDS마다 주석(ping)을 보내 연결을 유지합니다.
+    """
+    topic = month_topic(year, month)
+
+    async def event_stream():
+        async with event_broker.subscribe(topic) as queue:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.EVENT_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {dumps(event).decode()}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/templates", response_model=List[ScheduleTemplateResponse])
+async def get_schedule_templates(
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """반복 일정 템플릿 목록 (관리자 전용)"""
+    result = await db.scalars(select(ScheduleTemplate).order_by(ScheduleTemplate.weekday, ScheduleTemplate.start_time))
+    return [ScheduleTemplateResponse.from_orm_with_mapping(template) for template in result.all()]
+
+
+@router.post("/templates", response_model=ScheduleTemplateResponse)
+async def create_schedule_template(
+    template_data: ScheduleTemplateCreate,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """반복 일정 템플릿 생성 (관리자 전용)"""
+    start_time, end_time = _parse_schedule_times(template_data)
+
+    if not 0 <= template_data.weekday <= 6:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="요일은 0(월요일)부터 6(일요일) 사이여야 합니다.",
+        )
+
+    if template_data.validUntil is not None and template_data.validUntil < template_data.validFrom:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료일은 시작일 이후여야 합니다.",
+        )
+
+    template = ScheduleTemplate(
+        title=template_data.title,
+        description=template_data.description,
+        weekday=template_data.weekday,
+        start_time=start_time,
+        end_time=end_time,
+        location=template_data.location,
+        capacity=template_data.capacity,
+        valid_from=template_data.validFrom,
+        valid_until=template_data.validUntil,
+        created_by=current_admin.id,
+    )
+    db.add(template)
+    await db.commit()
+    await db.refresh(template)
+    await invalidate_templates()
+
+    return ScheduleTemplateResponse.from_orm_with_mapping(template)
+
+
+@router.put("/templates/{template_id}", response_model=ScheduleTemplateResponse)
+async def update_schedule_template(
+    template_id: int,
+    template_data: ScheduleTemplateUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    반복 일정 템플릿 수정 (관리자 전용)
+
+    아직 저장되지 않은 회차에만 반영되며, 이미 지원 / 수정으로 저장된 일정은 그대로 유지됩니다.
+    """
+    template = await db.get(ScheduleTemplate, template_id)
+    if not template:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="템플릿을 찾을 수 없습니다.",
+        )
+
+    if template_data.title is not None:
+        template.title = template_data.title
+    if template_data.description is not None:
+        template.description = template_data.description
+    if template_data.startTime is not None:
+        template.start_time = _parse_time(template_data.startTime)
+    if template_data.endTime is not None:
+        template.end_time = _parse_time(template_data.endTime)
+    if template_data.capacity is not None:
+        if template_data.capacity < 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="정원은 1명 이상이어야 합니다.",
+            )
+        template.capacity = template_data.capacity
+    if template_data.validUntil is not None:
+        template.valid_until = template_data.validUntil
+
+    if template.start_time >= template.end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료 시간은 시작 시간 이후여야 합니다.",
+        )
+
+    await db.commit()
+    await db.refresh(template)
+    await invalidate_templates()
 
-    result = []
-    for schedule in schedules:
-        applicant_count = db.query(func.count(Application.id)).filter(
-            Application.schedule_id == schedule.id,
-            Application.status == ApplicationStatus.APPLIED,
-        ).scalar()
+    return ScheduleTemplateResponse.from_orm_with_mapping(template)
 
-        is_applied = False
-        if current_user:
-            application = db.query(Application).filter(
-                Application.user_id == current_user.id,
-                Application.schedule_id == schedule.id,
-                Application.status == ApplicationStatus.APPLIED,
-            ).first()
-            is_applied = application is not None
 
-        result.append(ScheduleResponse.from_orm_with_mapping(
-            schedule,
-            applicant_count=applicant_count,
-            is_applied=is_applied,
-        ))
+@router.delete("/templates/{template_id}")
+async def delete_schedule_template(
+    template_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """반복 일정 템플릿 삭제 (관리자 전용, 이미 저장된 일정은 유지)"""
+    template = await db.get(ScheduleTemplate, template_id)
+    if not template:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="템플릿을 찾을 수 없습니다.",
+        )
+
+    await db.execute(
+        delete(ScheduleTemplateException).where(ScheduleTemplateException.template_id == template_id)
+    )
+    await db.execute(
+        update(Schedule)
+        .where(Schedule.template_id == template_id)
+        .values(template_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.delete(template)
+    await db.commit()
+    await invalidate_templates()
 
-    return result
+    return {"message": "템플릿이 삭제되었습니다."}
 
 
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
 async def get_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """일정 상세 조회"""
-    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    """일정 상세 조회 (저장되지 않은 반복 일정 회차 포함)"""
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
+        occurrence = await get_virtual_occurrence(db, schedule_id)
+        if occurrence:
+            return occurrence
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="일정을 찾을 수 없습니다.",
         )
 
-    applicant_count = db.query(func.count(Application.id)).filter(
-        Application.schedule_id == schedule.id,
-        Application.status == ApplicationStatus.APPLIED,
-    ).scalar()
-
-    is_applied = False
-    if current_user:
-        application = db.query(Application).filter(
-            Application.user_id == current_user.id,
-            Application.schedule_id == schedule.id,
-            Application.status == ApplicationStatus.APPLIED,
-        ).first()
-        is_applied = application is not None
-
-    return ScheduleResponse.from_orm_with_mapping(
-        schedule,
-        applicant_count=applicant_count,
-        is_applied=is_applied,
-    )
+    responses = await build_schedule_responses(db, [schedule], current_user)
+    return responses[0]
 
 
 @router.post("", response_model=ScheduleResponse)
 async def create_schedule(
     schedule_data: ScheduleCreate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     """일정 생성 (관리자 전용)"""
-    try:
-        start_time = datetime.strptime(schedule_data.startTime, "%H:%M").time()
-        end_time = datetime.strptime(schedule_data.endTime, "%H:%M").time()
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="시간 형식이 올바르지 않습니다. (HH:MM)",
-        )
-
-    if start_time >= end_time:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="종료 시간은 시작 시간 이후여야 합니다.",
-        )
+    start_time, end_time = _parse_schedule_times(schedule_data)
 
     schedule = Schedule(
         title=schedule_data.title,
@@ -168,30 +338,93 @@ async def create_schedule(
         start_time=start_time,
         end_time=end_time,
         location=schedule_data.location,
+        capacity=schedule_data.capacity,
         created_by=current_admin.id,
     )
     db.add(schedule)
-    db.commit()
-    db.refresh(schedule)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=SLOT_TAKEN_DETAIL,
+        )
+    await db.refresh(schedule)
+    await invalidate_schedule_months(schedule.date)
+    await publish_schedule_change("created", schedule.date, schedule_id=schedule.id)
 
     return ScheduleResponse.from_orm_with_mapping(schedule, applicant_count=0, is_applied=False)
 
 
+@router.post("/bulk", response_model=ScheduleBulkResponse)
+async def bulk_create_schedules(
+    bulk_data: ScheduleBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    일정 일괄 등록 / 주·월 단위 복사 (관리자 전용)
+
+    (날짜, 시작 시간, 장소)가 같은 일정은 갱신(복사 시에는 건너뜀)되므로
+    같은 요청을 반복해도 결과가 같습니다. 전체가 하나의 트랜잭션으로 처리되며,
+    기존 일정의 정원을 현재 지원자 수보다 적게 바꾸는 항목이 있으면 409를 반환합니다.
+    """
+    rows = []
+    for schedule_data in bulk_data.schedules:
+        start_time, end_time = _parse_schedule_times(schedule_data)
+        rows.append({
+            "title": schedule_data.title,
+            "description": schedule_data.description,
+            "date": schedule_data.date,
+            "start_time": start_time,
+            "end_time": end_time,
+            "location": schedule_data.location,
+            "capacity": schedule_data.capacity,
+            "created_by": current_admin.id,
+        })
+
+    plan = []
+    if bulk_data.clone is not None:
+        clone = bulk_data.clone
+        plan = plan_clone(clone.unit, clone.sourceStart, clone.targetStart)
+
+    upserted = await bulk_upsert_schedules(db, rows)
+    if upserted is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=CAPACITY_BELOW_APPLICANTS_DETAIL,
+        )
+    cloned = await clone_schedules(db, plan, current_admin.id)
+    await db.commit()
+
+    target_dates = [row["date"] for row in rows]
+    for source_from, source_to, shift in plan:
+        target_dates.append(source_from + timedelta(days=shift))
+        target_dates.append(source_to + timedelta(days=shift))
+    await invalidate_schedule_months(*target_dates)
+    await publish_schedule_change("created", *target_dates)
+
+    return ScheduleBulkResponse(upserted=upserted, cloned=cloned)
+
+
 @router.put("/{schedule_id}", response_model=ScheduleResponse)
 async def update_schedule(
     schedule_id: int,
     schedule_data: ScheduleUpdate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
-    """일정 수정 (관리자 전용)"""
-    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    """일정 수정 (관리자 전용, 반복 일정 회차는 이때 저장됨)"""
+    schedule = await materialize_occurrence(db, schedule_id)
     if not schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="일정을 찾을 수 없습니다.",
         )
 
+    previous_date = schedule.date
     if schedule_data.title is not None:
         schedule.title = schedule_data.title
     if schedule_data.description is not None:
@@ -199,38 +432,77 @@ async def update_schedule(
     if schedule_data.date is not None:
         schedule.date = schedule_data.date
     if schedule_data.startTime is not None:
-        schedule.start_time = datetime.strptime(schedule_data.startTime, "%H:%M").time()
+        schedule.start_time = _parse_time(schedule_data.startTime)
     if schedule_data.endTime is not None:
-        schedule.end_time = datetime.strptime(schedule_data.endTime, "%H:%M").time()
+        schedule.end_time = _parse_time(schedule_data.endTime)
     if schedule_data.location is not None:
         schedule.location = schedule_data.location
+    if schedule_data.capacity is not None:
+        if schedule_data.capacity < 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="정원은 1명 이상이어야 합니다.",
+            )
+        if schedule_data.capacity < schedule.applicant_count:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=CAPACITY_BELOW_APPLICANTS_DETAIL,
+            )
+        schedule.capacity = schedule_data.capacity
+
+    # 반복 일정 회차의 날짜를 옮긴 경우 원래 날짜에 회차가 다시 나타나지 않도록 제외
+    moved_occurrence = schedule.template_id is not None and schedule.date != previous_date
+    if moved_occurrence:
+        await add_template_exception(db, schedule.template_id, previous_date)
 
-    db.commit()
-    db.refresh(schedule)
-
-    applicant_count = db.query(func.count(Application.id)).filter(
-        Application.schedule_id == schedule.id,
-        Application.status == ApplicationStatus.APPLIED,
-    ).scalar()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=SLOT_TAKEN_DETAIL,
+        )
+    await db.refresh(schedule)
+    await invalidate_schedule_months(previous_date, schedule.date)
+    if moved_occurrence:
+        await invalidate_templates()
+    await publish_schedule_change("updated", previous_date, schedule.date, schedule_id=schedule.id)
 
-    return ScheduleResponse.from_orm_with_mapping(schedule, applicant_count=applicant_count, is_applied=False)
+    return ScheduleResponse.from_orm_with_mapping(schedule, applicant_count=schedule.applicant_count, is_applied=False)
 
 
 @router.delete("/{schedule_id}")
 async def delete_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
 ):
-    """일정 삭제 (관리자 전용)"""
-    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    """일정 삭제 (관리자 전용, 반복 일정 회차는 제외 날짜로 기록)"""
+    schedule = await get_schedule_by_id(db, schedule_id)
     if not schedule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일정을 찾을 수 없습니다.",
-        )
-
-    db.delete(schedule)
-    db.commit()
+        occurrence = await get_virtual_occurrence(db, schedule_id)
+        if not occurrence:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="일정을 찾을 수 없습니다.",
+            )
+
+        occurrence_date = date.fromisoformat(occurrence.date)
+        await add_template_exception(db, occurrence.templateId, occurrence_date)
+        await db.commit()
+        await invalidate_templates()
+        await publish_schedule_change("deleted", occurrence_date, schedule_id=schedule_id)
+        return {"message": "일정이 삭제되었습니다."}
+
+    if schedule.template_id is not None:
+        await add_template_exception(db, schedule.template_id, schedule.date)
+
+    await db.delete(schedule)
+    await db.commit()
+    await invalidate_schedule_months(schedule.date)
+    if schedule.template_id is not None:
+        await invalidate_templates()
+    await publish_schedule_change("deleted", schedule.date, schedule_id=schedule_id)
 
     return {"message": "일정이 삭제되었습니다."}
@@ -10,10 +10,18 @@ from app.schemas.schedule import (
     ScheduleCreate,
     ScheduleUpdate,
     ScheduleResponse,
+    ScheduleBulkRequest,
+    ScheduleBulkResponse,
+    ScheduleCloneRequest,
+    ScheduleTemplateCreate,
+    ScheduleTemplateUpdate,
+    ScheduleTemplateResponse,
 )
 from app.schemas.application import (
     ApplicationCreate,
     ApplicationResponse,
+    ScheduleRosterResponse,
+    CompactScheduleRoster,
 )
 from app.schemas.notice import (
     NoticeCreate,
@@ -35,8 +43,16 @@ __all__ = [
     "ScheduleCreate",
     "ScheduleUpdate",
     "ScheduleResponse",
+    "ScheduleBulkRequest",
+    "ScheduleBulkResponse",
+    "ScheduleCloneRequest",
+    "ScheduleTemplateCreate",
+    "ScheduleTemplateUpdate",
+    "ScheduleTemplateResponse",
     "ApplicationCreate",
     "ApplicationResponse",
+    "ScheduleRosterResponse",
+    "CompactScheduleRoster",
     "NoticeCreate",
     "NoticeUpdate",
     "NoticeResponse",
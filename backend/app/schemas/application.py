@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from app.schemas.schedule import ScheduleResponse
@@ -44,3 +44,19 @@ class ApplicationResponse(BaseModel):
             schedule=schedule,
             user=user,
         )
+
+
+class ScheduleRosterResponse(BaseModel):
+    schedule: ScheduleResponse
+    applicants: List[ApplicationResponse]
+
+
+class RosterApplicant(BaseModel):
+    userId: int
+    name: str
+
+
+class CompactScheduleRoster(BaseModel):
+    scheduleId: int
+    title: str
+    applicants: List[RosterApplicant]
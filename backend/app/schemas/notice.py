@@ -54,3 +54,4 @@ class PaginatedNoticeResponse(BaseModel):
     page: int
     pageSize: int
     totalPages: int
+    nextCursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+import datetime as dt
 from datetime import date, time, datetime
 
 
@@ -10,15 +11,90 @@ class ScheduleCreate(BaseModel):
     startTime: str  # "HH:MM" format
     endTime: str    # "HH:MM" format
     location: Optional[str] = None
+    capacity: Optional[int] = None  # 정원 (없으면 제한 없음)
 
 
 class ScheduleUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
-    date: Optional[date] = None
+    date: Optional[dt.date] = None  # 필드 이름이 date 타입을 가리지 않도록 dt.date 사용
     startTime: Optional[str] = None
     endTime: Optional[str] = None
     location: Optional[str] = None
+    capacity: Optional[int] = None
+
+
+class ScheduleCloneRequest(BaseModel):
+    unit: Literal["week", "month"]
+    sourceStart: date  # week: 복사할 주의 시작일 / month: 복사할 월의 아무 날짜
+    targetStart: date  # week: 대상 주의 시작일 / month: 대상 월의 아무 날짜
+
+
+# 일괄 등록 요청 한 번에 보낼 수 있는 일정 수 (초과 시 422)
+BULK_MAX_SCHEDULES = 500
+
+
+class ScheduleBulkRequest(BaseModel):
+    schedules: List[ScheduleCreate] = Field(default_factory=list, max_length=BULK_MAX_SCHEDULES)
+    clone: Optional[ScheduleCloneRequest] = None
+
+
+class ScheduleBulkResponse(BaseModel):
+    upserted: int  # schedules 항목 중 생성 / 갱신된 수
+    cloned: int    # 복사로 새로 생성된 수
+
+
+class ScheduleTemplateCreate(BaseModel):
+    title: str
+    description: Optional[str] = None
+    weekday: int  # 0=월요일 ... 6=일요일
+    startTime: str  # "HH:MM" format
+    endTime: str    # "HH:MM" format
+    location: str
+    capacity: Optional[int] = None
+    validFrom: date
+    validUntil: Optional[date] = None
+
+
+class ScheduleTemplateUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    startTime: Optional[str] = None
+    endTime: Optional[str] = None
+    capacity: Optional[int] = None
+    validUntil: Optional[date] = None
+
+
+class ScheduleTemplateResponse(BaseModel):
+    id: int
+    title: str
+    description: Optional[str]
+    weekday: int
+    startTime: str
+    endTime: str
+    location: str
+    capacity: Optional[int] = None
+    validFrom: str
+    validUntil: Optional[str] = None
+    createdBy: int
+    createdAt: datetime
+
+    @classmethod
+    def from_orm_with_mapping(cls, obj):
+        return cls(
+            id=obj.id,
+            title=obj.title,
+            description=obj.description,
+            weekday=obj.weekday,
+            startTime=obj.start_time.strftime("%H:%M:%S"),
+            endTime=obj.end_time.strftime("%H:%M:%S"),
+            location=obj.location,
+            capacity=obj.capacity,
+            validFrom=obj.valid_from.isoformat(),
+            validUntil=obj.valid_until.isoformat() if obj.valid_until else None,
+            createdBy=obj.created_by,
+            createdAt=obj.created_at,
+        )
 
 
 class ScheduleResponse(BaseModel):
@@ -29,10 +105,12 @@ class ScheduleResponse(BaseModel):
     startTime: str
     endTime: str
     location: Optional[str]
+    capacity: Optional[int] = None
     createdBy: int
     createdAt: datetime
     applicantCount: Optional[int] = None
     isApplied: Optional[bool] = None
+    templateId: Optional[int] = None  # 반복 일정 회차인 경우 템플릿 ID
 
     class Config:
         from_attributes = True
@@ -47,8 +125,10 @@ class ScheduleResponse(BaseModel):
             startTime=obj.start_time.strftime("%H:%M:%S"),
             endTime=obj.end_time.strftime("%H:%M:%S"),
             location=obj.location,
+            capacity=obj.capacity,
             createdBy=obj.created_by,
             createdAt=obj.created_at,
             applicantCount=applicant_count,
             isApplied=is_applied,
+            templateId=obj.template_id,
         )
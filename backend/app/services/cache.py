@@ -0,0 +1,153 @@
+"""
+캐시 서비스
+
+Redis가 설정되어 있으면 Redis를, 그렇지 않으면 TTL이 있는 프로세스 내부
+LRU 캐시를 사용합니다. 값은 JSON으로 직렬화 가능한 데이터만 저장합니다.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.config import settings
+
+
+class CacheBackend:
+    """캐시 백엔드 공통 인터페이스 (hit / miss 카운터 포함)"""
+
+    name = "base"
+    shared = False  # 여러 인스턴스 / 워커가 같은 값을 보는지 여부
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str, track: bool = True) -> Optional[Any]:
+        value = await self._get(key)
+        if track:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    async def _get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class MemoryCache(CacheBackend):
+    """크기 제한과 TTL이 있는 프로세스 내부 LRU 캐시"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 300):
+        super().__init__()
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def _get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        self.discard(*keys)
+
+    def discard(self, *keys: str) -> None:
+        """동기 컨텍스트(ORM 이벤트 등)에서 사용할 수 있는 삭제"""
+        for key in keys:
+            self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._data), "maxEntries": self.max_entries}
+
+
+class RedisCache(CacheBackend):
+    """Redis 캐시 (장애 시 캐시 미스로 처리)"""
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, default_ttl: int = 300, prefix: str = "jangan:"):
+        super().__init__()
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+        self.errors = 0
+
+    async def _get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self.client.get(self.prefix + key)
+        except Exception as e:
+            self.errors += 1
+            print(f"Redis 조회 실패: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            await self.client.set(self.prefix + key, json.dumps(value), ex=ttl or self.default_ttl)
+        except Exception as e:
+            self.errors += 1
+            print(f"Redis 저장 실패: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            self.errors += 1
+            print(f"Redis 삭제 실패: {e}")
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "errors": self.errors}
+
+
+def create_cache() -> CacheBackend:
+    if settings.REDIS_URL:
+        return RedisCache(settings.REDIS_URL, default_ttl=settings.CACHE_TTL_SECONDS)
+    return MemoryCache(max_entries=settings.CACHE_MAX_ENTRIES, default_ttl=settings.CACHE_TTL_SECONDS)
+
+
+cache = create_cache()
@@ -0,0 +1,168 @@
+"""
+실시간 이벤트 pub/sub
+
+일정 좌석 수 변동 등 이벤트를 토픽(월 단위) 구독자에게 전달합니다.
+구독은 항상 프로세스 내부 큐로 처리되며, REDIS_URL이 설정되어 있으면 발행은
+Redis pub/sub을 거쳐 모든 워커의 구독자에게 전달됩니다. 구독자는 DB 커넥션을
+사용하지 않으므로 유휴 구독자가 많아도 풀에 영향을 주지 않습니다.
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import AsyncIterator, Dict, Optional, Set
+
+from app.config import settings
+
+
+class EventBroker:
+    """프로세스 내부 pub/sub"""
+
+    name = "memory"
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[topic].add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def deliver(self, topic: str, event: dict) -> None:
+        """이 프로세스의 구독자에게 전달 (느린 구독자는 오래된 이벤트부터 버림)"""
+        for queue in list(self._subscribers.get(topic, ())):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+
+    async def publish(self, topic: str, event: dict) -> None:
+        self.deliver(topic, event)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "topics": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "dropped": self.dropped,
+        }
+
+
+class RedisEventBroker(EventBroker):
+    """Redis pub/sub을 통한 워커 간 전달 (Redis 장애 시 이 프로세스에만 전달)"""
+
+    name = "redis"
+
+    def __init__(self, url: str, queue_size: int = 100, prefix: str = "jangan:events:"):
+        super().__init__(queue_size)
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+        self.errors = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        await self.client.aclose()
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.psubscribe(self.prefix + "*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    topic = message["channel"].decode()[len(self.prefix):]
+                    self.deliver(topic, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                print(f"Redis 이벤트 구독 실패: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    async def publish(self, topic: str, event: dict) -> None:
+        try:
+            await self.client.publish(self.prefix + topic, json.dumps(event))
+        except Exception as e:
+            self.errors += 1
+            print(f"Redis 이벤트 발행 실패: {e}")
+            self.deliver(topic, event)
+
+    def stats(self) -> dict:
+        return {**super().stats(), "errors": self.errors}
+
+
+def create_event_broker() -> EventBroker:
+    if settings.REDIS_URL:
+        return RedisEventBroker(settings.REDIS_URL, queue_size=settings.EVENT_QUEUE_SIZE)
+    return EventBroker(queue_size=settings.EVENT_QUEUE_SIZE)
+
+
+event_broker = create_event_broker()
+
+
+def month_topic(year: int, month: int) -> str:
+    return f"schedules:{year:04d}-{month:02d}"
+
+
+async def publish_seat_change(
+    schedule_id: int,
+    schedule_date: date,
+    applicant_count: int,
+    capacity: Optional[int],
+    delta: int,
+    occurrence_id: Optional[int] = None,
+) -> None:
+    """지원 / 취소에 따른 좌석 수 변동 (occurrence_id: 이번 지원으로 저장된 반복 일정 회차의 가상 ID)"""
+    event = {
+        "type": "seats",
+        "scheduleId": schedule_id,
+        "date": schedule_date.isoformat(),
+        "applicantCount": applicant_count,
+        "capacity": capacity,
+        "delta": delta,
+    }
+    if occurrence_id is not None:
+        event["occurrenceId"] = occurrence_id
+    await event_broker.publish(month_topic(schedule_date.year, schedule_date.month), event)
+
+
+async def publish_schedule_change(action: str, *dates: Optional[date], schedule_id: Optional[int] = None) -> None:
+    """일정 생성 / 수정 / 삭제 (클라이언트는 해당 월을 다시 조회)"""
+    months = {(d.year, d.month) for d in dates if d is not None}
+    for year, month in months:
+        await event_broker.publish(month_topic(year, month), {
+            "type": "schedule",
+            "action": action,
+            "scheduleId": schedule_id,
+        })
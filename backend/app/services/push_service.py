@@ -3,13 +3,28 @@
 
 Firebase Cloud Messaging을 사용하여 푸시 알림을 발송합니다.
 Firebase 프로젝트 설정 후 firebase-credentials.json 파일을 설정해야 합니다.
+
+발송은 PushDispatcher가 담당합니다. 토큰 목록을 FCM 한도(500개) 단위로 나누어
+내부 큐에 넣고, 워커 태스크가 이벤트 루프 밖의 스레드에서 발송한 뒤 일시적인
+오류는 지수 백오프로 재시도합니다. 발송 수단(PushTransport)은 교체할 수 있어
+테스트나 벤치마크에서는 FakeTransport를 사용할 수 있습니다.
 """
 
+import asyncio
 import os
-from typing import List, Optional
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from app.config import settings
 
+# FCM multicast 1회 발송 최대 토큰 수
+FCM_BATCH_SIZE = 500
+
+# 재시도 대상 FCM 오류 코드
+TRANSIENT_ERROR_CODES = {"UNAVAILABLE", "INTERNAL", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED"}
+
 # Firebase 초기화는 credentials 파일이 있을 때만 수행
 firebase_app = None
 
@@ -25,6 +40,223 @@ except Exception as e:
     print(f"Firebase 초기화 실패: {e}")
 
 
+@dataclass
+class TokenResult:
+    """토큰별 발송 결과"""
+    token: str
+    success: bool
+    error: Optional[str] = None
+    retryable: bool = False
+
+
+class PushTransport:
+    """발송 수단 인터페이스 (워커 스레드에서 동기적으로 호출됨)"""
+
+    def send_batch(
+        self,
+        tokens: List[str],
+        title: str,
+        body: str,
+        data: Dict[str, str],
+    ) -> List[TokenResult]:
+        raise NotImplementedError
+
+
+class FirebaseTransport(PushTransport):
+    """Firebase Admin SDK를 통한 발송"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def send_batch(self, tokens, title, body, data):
+        message = messaging.MulticastMessage(
+            notification=messaging.Notification(
+                title=title,
+                body=body,
+            ),
+            data=data,
+            tokens=tokens,
+        )
+        response = messaging.send_each_for_multicast(message, app=self.app)
+
+        results = []
+        for token, send_response in zip(tokens, response.responses):
+            if send_response.success:
+                results.append(TokenResult(token=token, success=True))
+            else:
+                code = getattr(send_response.exception, "code", None)
+                results.append(TokenResult(
+                    token=token,
+                    success=False,
+                    error=str(send_response.exception),
+                    retryable=code in TRANSIENT_ERROR_CODES,
+                ))
+        return results
+
+
+class FakeTransport(PushTransport):
+    """로컬 테스트 / 벤치마크용 가짜 FCM"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failing_tokens: Optional[set] = None,
+        transient_failures: int = 0,
+    ):
+        self.latency = latency
+        self.failing_tokens = failing_tokens or set()
+        # 처음 N번의 요청은 네트워크 오류처럼 요청 전체가 실패
+        self.transient_failures = transient_failures
+        self.attempts: List[List[str]] = []
+        self.sent: List[dict] = []
+
+    def send_batch(self, tokens, title, body, data):
+        if self.latency:
+            time.sleep(self.latency)
+        self.attempts.append(list(tokens))
+        if self.transient_failures:
+            self.transient_failures -= 1
+            raise ConnectionError("UNAVAILABLE")
+        self.sent.append({"tokens": list(tokens), "title": title, "body": body, "data": data})
+        return [
+            TokenResult(token=token, success=False, error="invalid token")
+            if token in self.failing_tokens
+            else TokenResult(token=token, success=True)
+            for token in tokens
+        ]
+
+
+@dataclass
+class _PushJob:
+    tokens: List[str]
+    title: str
+    body: str
+    data: Dict[str, str]
+    future: asyncio.Future = field(repr=False)
+
+
+class PushDispatcher:
+    """큐 기반 배치 발송기"""
+
+    def __init__(
+        self,
+        transport: Optional[PushTransport],
+        workers: int = 2,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        batch_size: int = FCM_BATCH_SIZE,
+    ):
+        self.transport = transport
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """대기 중인 작업을 모두 처리한 뒤 워커 종료"""
+        if not self.running:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        tokens: List[str],
+        title: str,
+        body: str,
+        data: Optional[dict] = None,
+    ) -> List[TokenResult]:
+        """토큰 목록을 배치로 나누어 큐에 넣고 토큰별 결과 반환"""
+        if not tokens:
+            return []
+        if not self.running:
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+        jobs = []
+        for i in range(0, len(tokens), self.batch_size):
+            job = _PushJob(
+                tokens=tokens[i:i + self.batch_size],
+                title=title,
+                body=body,
+                data=data or {},
+                future=loop.create_future(),
+            )
+            jobs.append(job)
+            await self._queue.put(job)
+
+        batches = await asyncio.gather(*(job.future for job in jobs))
+        return [result for batch in batches for result in batch]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                results = await self._send_with_retry(job)
+                if not job.future.done():
+                    job.future.set_result(results)
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def _send_with_retry(self, job: _PushJob) -> List[TokenResult]:
+        final: Dict[str, TokenResult] = {}
+        pending = job.tokens
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                results = await asyncio.to_thread(
+                    self.transport.send_batch, pending, job.title, job.body, job.data,
+                )
+            except Exception as e:
+                # 요청 전체 실패 (네트워크 오류 등)는 재시도 대상
+                results = [
+                    TokenResult(token=token, success=False, error=str(e), retryable=True)
+                    for token in pending
+                ]
+
+            retry_tokens = []
+            for result in results:
+                if not result.success and result.retryable and attempt < self.max_retries:
+                    retry_tokens.append(result.token)
+                else:
+                    final[result.token] = result
+
+            if not retry_tokens:
+                break
+
+            pending = retry_tokens
+            delay = self.backoff * (2 ** attempt)
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+        return [final[token] for token in job.tokens]
+
+
+push_dispatcher = PushDispatcher(
+    transport=FirebaseTransport(firebase_app) if firebase_app else None,
+    workers=settings.PUSH_WORKERS,
+    max_retries=settings.PUSH_MAX_RETRIES,
+    backoff=settings.PUSH_RETRY_BACKOFF_SECONDS,
+)
+
+
 async def send_push_notification(
     token: str,
     title: str,
@@ -43,25 +275,7 @@ async def send_push_notification(
     Returns:
         성공 여부
     """
-    if not firebase_app:
-        print("Firebase가 초기화되지 않았습니다.")
-        return False
-
-    try:
-        message = messaging.Message(
-            notification=messaging.Notification(
-                title=title,
-                body=body,
-            ),
-            data=data or {},
-            token=token,
-        )
-        response = messaging.send(message)
-        print(f"푸시 알림 발송 성공: {response}")
-        return True
-    except Exception as e:
-        print(f"푸시 알림 발송 실패: {e}")
-        return False
+    return await send_push_notification_to_multiple([token], title, body, data) == 1
 
 
 async def send_push_notification_to_multiple(
@@ -82,28 +296,17 @@ async def send_push_notification_to_multiple(
     Returns:
         성공한 발송 수
     """
-    if not firebase_app:
+    if push_dispatcher.transport is None:
         print("Firebase가 초기화되지 않았습니다.")
         return 0
 
     if not tokens:
         return 0
 
-    try:
-        message = messaging.MulticastMessage(
-            notification=messaging.Notification(
-                title=title,
-                body=body,
-            ),
-            data=data or {},
-            tokens=tokens,
-        )
-        response = messaging.send_each_for_multicast(message)
-        print(f"푸시 알림 발송: 성공 {response.success_count}, 실패 {response.failure_count}")
-        return response.success_count
-    except Exception as e:
-        print(f"푸시 알림 발송 실패: {e}")
-        return 0
+    results = await push_dispatcher.submit(tokens, title, body, data)
+    success_count = sum(1 for result in results if result.success)
+    print(f"푸시 알림 발송: 성공 {success_count}, 실패 {len(results) - success_count}")
+    return success_count
 
 
 async def send_schedule_notification(
@@ -120,15 +323,21 @@ async def send_schedule_notification(
     )
 
 
+def reminder_message(schedule_title: str) -> tuple:
+    """봉사 1일 전 리마인더 (제목, 내용)"""
+    return "봉사 일정 리마인더", f"내일 '{schedule_title}' 봉사가 예정되어 있습니다."
+
+
 async def send_reminder_notification(
     tokens: List[str],
     schedule_title: str,
-):
+) -> int:
     """봉사 1일 전 리마인더"""
-    await send_push_notification_to_multiple(
+    title, body = reminder_message(schedule_title)
+    return await send_push_notification_to_multiple(
         tokens=tokens,
-        title="봉사 일정 리마인더",
-        body=f"내일 '{schedule_title}' 봉사가 예정되어 있습니다.",
+        title=title,
+        body=body,
         data={"type": "reminder"},
     )
 
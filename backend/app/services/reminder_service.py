@@ -0,0 +1,183 @@
+"""
+봉사 1일 전 리마인더 스케줄러
+
+매일 REMINDER_HOUR(KST) 이후 다음 날 일정의 지원자에게 리마인더를 발송합니다.
+job_leases 테이블의 조건부 UPDATE로 실행권을 얻으므로 여러 워커 / 재시작
+환경에서도 하루 한 번, 한 워커에서만 실행됩니다. 실행 중에는 실행권을 주기적으로
+연장하며, 워커가 중단되면 REMINDER_LEASE_SECONDS 이후 다른 워커가 다시 실행합니다.
+
+리마인더 알림은 (사용자, 일정, 종류, 일정 날짜) 유일 제약으로 한 번만 저장되고,
+푸시는 이번 실행에서 새로 저장된 알림에 대해서만 발송되므로 재실행되어도
+같은 리마인더가 다시 발송되지 않습니다.
+"""
+
+import asyncio
+import os
+import socket
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Select, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.user import User
+from app.models.schedule import Schedule
+from app.models.application import Application, ApplicationStatus
+from app.models.notification import Notification, NotificationType
+from app.models.job_lease import JobLease
+from app.services.push_service import reminder_message, send_reminder_notification
+
+REMINDER_JOB = "daily-reminder"
+KST = timezone(timedelta(hours=9))
+
+
+async def acquire_lease(db: AsyncSession, name: str, owner: str, run_date: date) -> bool:
+    """오늘 아직 완료되지 않았고 다른 워커가 실행 중이 아닐 때만 실행권 획득"""
+    if await db.get(JobLease, name) is None:
+        db.add(JobLease(name=name))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(JobLease)
+        .where(
+            JobLease.name == name,
+            or_(JobLease.last_completed_on.is_(None), JobLease.last_completed_on < run_date),
+            or_(JobLease.lease_until.is_(None), JobLease.lease_until < now),
+        )
+        .values(owner=owner, lease_until=now + timedelta(seconds=settings.REMINDER_LEASE_SECONDS))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def complete_lease(db: AsyncSession, name: str, owner: str, run_date: date) -> None:
+    await db.execute(
+        update(JobLease)
+        .where(JobLease.name == name, JobLease.owner == owner)
+        .values(last_completed_on=run_date, lease_until=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def renew_lease(name: str, owner: str) -> bool:
+    """실행 중인 작업의 실행권 연장 (다른 워커에게 넘어갔으면 False)"""
+    async with SessionLocal() as db:
+        result = await db.execute(
+            update(JobLease)
+            .where(JobLease.name == name, JobLease.owner == owner)
+            .values(lease_until=datetime.now(timezone.utc) + timedelta(seconds=settings.REMINDER_LEASE_SECONDS))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    return result.rowcount == 1
+
+
+async def _keep_lease(name: str, owner: str) -> None:
+    """작업이 끝날 때까지 실행권 유지 시간의 1/3마다 연장"""
+    while True:
+        await asyncio.sleep(settings.REMINDER_LEASE_SECONDS / 3)
+        if not await renew_lease(name, owner):
+            print(f"작업 실행권을 잃었습니다: {name}")
+            return
+
+
+def reminder_recipients_query(target_date: date) -> Select:
+    """target_date 일정의 (일정 ID, 제목, 사용자 ID, FCM 토큰) 조회 쿼리"""
+    return (
+        select(Schedule.id, Schedule.title, User.id, User.fcm_token)
+        .join(Application, Application.schedule_id == Schedule.id)
+        .join(User, User.id == Application.user_id)
+        .where(
+            Schedule.date == target_date,
+            Application.status == ApplicationStatus.APPLIED,
+            User.fcm_token.isnot(None),
+        )
+    )
+
+
+async def send_reminders_for(db: AsyncSession, target_date: date) -> int:
+    """target_date 일정의 지원자에게 리마인더 발송 후 성공 수 반환 (이미 저장된 리마인더는 건너뜀)"""
+    rows = (await db.execute(reminder_recipients_query(target_date))).all()
+
+    if not rows:
+        return 0
+
+    titles = {}
+    tokens = {}
+    notifications = []
+    for schedule_id, schedule_title, user_id, fcm_token in rows:
+        titles[schedule_id] = schedule_title
+        tokens[(user_id, schedule_id)] = fcm_token
+        title, body = reminder_message(schedule_title)
+        notifications.append({
+            "user_id": user_id,
+            "title": title,
+            "body": body,
+            "type": NotificationType.REMINDER,
+            "is_read": False,
+            "schedule_id": schedule_id,
+            "schedule_date": target_date,
+        })
+
+    insert = postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+    inserted = (await db.execute(
+        insert(Notification)
+        .values(notifications)
+        .on_conflict_do_nothing(index_elements=["user_id", "schedule_id", "type", "schedule_date"])
+        .returning(Notification.user_id, Notification.schedule_id)
+    )).all()
+    await db.commit()
+
+    # 이번 실행에서 새로 저장된 리마인더만 푸시 발송
+    tokens_by_schedule = defaultdict(list)
+    for user_id, schedule_id in inserted:
+        tokens_by_schedule[schedule_id].append(tokens[(user_id, schedule_id)])
+
+    results = await asyncio.gather(*(
+        send_reminder_notification(schedule_tokens, titles[schedule_id])
+        for schedule_id, schedule_tokens in tokens_by_schedule.items()
+    ))
+    return sum(results)
+
+
+async def run_daily_reminder(owner: str) -> None:
+    """오늘 분 리마인더 실행 (이미 완료되었거나 다른 워커가 실행 중이면 건너뜀)"""
+    today = datetime.now(KST).date()
+
+    async with SessionLocal() as db:
+        if not await acquire_lease(db, REMINDER_JOB, owner, today):
+            return
+
+        keeper = asyncio.create_task(_keep_lease(REMINDER_JOB, owner))
+        try:
+            sent = await send_reminders_for(db, today + timedelta(days=1))
+        finally:
+            keeper.cancel()
+            await asyncio.gather(keeper, return_exceptions=True)
+        await complete_lease(db, REMINDER_JOB, owner, today)
+
+    print(f"리마인더 발송 완료: {sent}건")
+
+
+async def run_reminder_scheduler() -> None:
+    """REMINDER_POLL_SECONDS 간격으로 실행 시각 도달 여부 확인"""
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    while True:
+        try:
+            if datetime.now(KST).hour >= settings.REMINDER_HOUR:
+                await run_daily_reminder(owner)
+        except Exception as e:
+            print(f"리마인더 실행 실패: {e}")
+
+        await asyncio.sleep(settings.REMINDER_POLL_SECONDS)
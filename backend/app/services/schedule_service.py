@@ -0,0 +1,448 @@
+"""
+일정 조회 서비스
+
+일정 목록과 지원자 수, 현재 사용자의 지원 여부를 일정 개수와 무관하게
+고정된 수의 쿼리로 조회합니다. 지원자 수는 Schedule.applicant_count에
+비정규화되어 있으며 지원 / 취소 시 정원(capacity) 조건과 함께
+원자적으로 증감됩니다. 월별 일정 목록과 지원자 수는 캐시되며,
+일정 / 지원 변경 시 해당 월의 캐시가 무효화됩니다.
+
+반복 일정 템플릿의 회차는 조회 시 저장된 일정과 합쳐지며, 지원 / 수정 시
+materialize_occurrence로 실제 행이 생성됩니다.
+
+목록 조회는 필요한 컬럼만 조회하여 응답 형태의 dict 목록을 반환하며,
+라우터가 pydantic 검증 없이 바로 JSON으로 인코딩합니다.
+"""
+
+import calendar
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Integer, Select, cast, func, literal, literal_column, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.schedule import Schedule
+from app.models.schedule_template import ScheduleTemplate, ScheduleTemplateException
+from app.models.application import Application, ApplicationStatus
+from app.schemas.schedule import ScheduleResponse
+from app.services.cache import cache
+from app.utils.http_cache import bump_versions
+from app.utils.serialization import schedule_item
+from app.services.template_service import (
+    expand_templates,
+    get_template_items,
+    occurrence_item,
+    occurs_on,
+    parse_occurrence_id,
+)
+
+
+def applied_schedule_ids_query(user_id: int, schedule_ids: Sequence[int]) -> Select:
+    """사용자가 지원한 일정 ID 조회 쿼리"""
+    return select(Application.schedule_id).where(
+        Application.user_id == user_id,
+        Application.schedule_id.in_(schedule_ids),
+        Application.status == ApplicationStatus.APPLIED,
+    )
+
+
+async def get_applied_schedule_ids(
+    db: AsyncSession,
+    user_id: int,
+    schedule_ids: Sequence[int],
+) -> Set[int]:
+    """사용자가 지원한 일정 ID 집합 (쿼리 1회)"""
+    if not schedule_ids:
+        return set()
+
+    result = await db.scalars(applied_schedule_ids_query(user_id, schedule_ids))
+
+    return set(result.all())
+
+
+async def build_schedule_responses(
+    db: AsyncSession,
+    schedules: List[Schedule],
+    current_user: Optional[User] = None,
+) -> List[ScheduleResponse]:
+    """일정 목록을 지원자 수 / 지원 여부와 함께 응답으로 변환"""
+    schedule_ids = [schedule.id for schedule in schedules]
+    applied_ids = (
+        await get_applied_schedule_ids(db, current_user.id, schedule_ids)
+        if current_user else set()
+    )
+
+    return [
+        ScheduleResponse.from_orm_with_mapping(
+            schedule,
+            applicant_count=schedule.applicant_count,
+            is_applied=schedule.id in applied_ids,
+        )
+        for schedule in schedules
+    ]
+
+
+# 목록 조회에 필요한 일정 컬럼 (ORM 객체를 만들지 않음)
+SCHEDULE_COLUMNS = (
+    Schedule.id,
+    Schedule.title,
+    Schedule.description,
+    Schedule.date,
+    Schedule.start_time,
+    Schedule.end_time,
+    Schedule.location,
+    Schedule.capacity,
+    Schedule.created_by,
+    Schedule.created_at,
+    Schedule.applicant_count,
+    Schedule.template_id,
+)
+
+
+def month_cache_key(year: int, month: int) -> str:
+    return f"schedules:month:{year:04d}-{month:02d}"
+
+
+def get_month_range(year: int, month: int) -> tuple:
+    """해당 월의 [시작일, 다음 달 1일) 범위"""
+    start_date = date(year, month, 1)
+    if month == 12:
+        end_date = date(year + 1, 1, 1)
+    else:
+        end_date = date(year, month + 1, 1)
+    return start_date, end_date
+
+
+def month_schedules_query(start_date: date, end_date: date) -> Select:
+    """[start_date, end_date) 기간의 일정 목록 쿼리"""
+    return select(*SCHEDULE_COLUMNS).where(
+        Schedule.date >= start_date,
+        Schedule.date < end_date,
+    ).order_by(Schedule.date, Schedule.start_time)
+
+
+def day_schedules_query(target_date: date) -> Select:
+    """특정 날짜의 일정 목록 쿼리"""
+    return select(*SCHEDULE_COLUMNS).where(
+        Schedule.date == target_date,
+    ).order_by(Schedule.start_time)
+
+
+async def get_month_schedules(
+    db: AsyncSession,
+    year: int,
+    month: int,
+    current_user: Optional[User] = None,
+) -> List[dict]:
+    """월별 일정 목록 (일정 + 지원자 수는 캐시, 지원 여부는 사용자별 조회, 반복 일정 회차 포함)"""
+    key = month_cache_key(year, month)
+    items = await cache.get(key)
+    start_date, end_date = get_month_range(year, month)
+
+    if items is None:
+        result = await db.execute(month_schedules_query(start_date, end_date))
+        items = [schedule_item(row) for row in result]
+        await cache.set(key, items)
+
+    return await _merge_schedule_items(db, items, start_date, end_date, current_user)
+
+
+async def get_day_schedules(
+    db: AsyncSession,
+    target_date: date,
+    current_user: Optional[User] = None,
+) -> List[dict]:
+    """특정 날짜의 일정 목록 (반복 일정 회차 포함)"""
+    result = await db.execute(day_schedules_query(target_date))
+    items = [schedule_item(row) for row in result]
+
+    return await _merge_schedule_items(db, items, target_date, target_date + timedelta(days=1), current_user)
+
+
+async def _merge_schedule_items(
+    db: AsyncSession,
+    items: List[dict],
+    start_date: date,
+    end_date: date,
+    current_user: Optional[User],
+) -> List[dict]:
+    """저장된 일정에 지원 여부를 채우고 반복 일정 회차를 합쳐 날짜 / 시간순으로 반환"""
+    applied_ids = (
+        await get_applied_schedule_ids(db, current_user.id, [item["id"] for item in items])
+        if current_user else set()
+    )
+
+    merged = [{**item, "isApplied": item["id"] in applied_ids} for item in items]
+    occurrences = expand_templates(await get_template_items(db), start_date, end_date, items)
+    if occurrences:
+        merged.extend(occurrences)
+        merged.sort(key=lambda item: (item["date"], item["startTime"]))
+    return merged
+
+
+async def invalidate_schedule_months(*dates: Optional[date]) -> None:
+    """일정 날짜가 속한 월의 캐시 무효화 및 버전(ETag) 갱신"""
+    keys = {month_cache_key(d.year, d.month) for d in dates if d is not None}
+    if keys:
+        await cache.delete(*keys)
+        await bump_versions(*keys)
+
+
+async def reserve_seat(db: AsyncSession, schedule_id: int) -> Optional[int]:
+    """
+    정원이 남아 있을 때만 지원자 수를 1 증가하고 증가된 지원자 수 반환 (커밋은 호출자가 수행)
+
+    조건부 UPDATE 한 문장으로 처리되므로 동시 요청에서도 정원을 초과하지 않습니다.
+    정원이 마감되었으면 None을 반환합니다.
+    """
+    result = await db.execute(
+        update(Schedule)
+        .where(
+            Schedule.id == schedule_id,
+            or_(
+                Schedule.capacity.is_(None),
+                Schedule.applicant_count < Schedule.capacity,
+            ),
+        )
+        .values(applicant_count=Schedule.applicant_count + 1)
+        .returning(Schedule.applicant_count)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none()
+
+
+async def release_seat(db: AsyncSession, schedule_id: int) -> Optional[int]:
+    """지원자 수를 1 감소하고 감소된 지원자 수 반환 (커밋은 호출자가 수행)"""
+    result = await db.execute(
+        update(Schedule)
+        .where(Schedule.id == schedule_id, Schedule.applicant_count > 0)
+        .values(applicant_count=Schedule.applicant_count - 1)
+        .returning(Schedule.applicant_count)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none()
+
+
+async def reconcile_applicant_counts(db: AsyncSession) -> int:
+    """applications 기준으로 지원자 수를 일괄 재계산하고 수정된 일정 수 반환"""
+    applied_count = (
+        select(func.count(Application.id))
+        .where(
+            Application.schedule_id == Schedule.id,
+            Application.status == ApplicationStatus.APPLIED,
+        )
+        .scalar_subquery()
+    )
+
+    result = await db.execute(
+        update(Schedule)
+        .where(Schedule.applicant_count != applied_count)
+        .values(applicant_count=applied_count)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+    return result.rowcount
+
+
+# uq_schedule_slot 인덱스와 같은 식 (장소가 없는 일정은 빈 문자열로 비교)
+SLOT_INDEX_ELEMENTS = [Schedule.date, Schedule.start_time, func.coalesce(Schedule.location, literal_column("''"))]
+
+
+def _insert_for(db: AsyncSession, model=Schedule):
+    """ON CONFLICT를 지원하는 방언별 INSERT"""
+    if db.bind.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def _shift_date(db: AsyncSession, column, days: int):
+    """날짜 컬럼을 days일 이동한 SQL 식"""
+    if db.bind.dialect.name == "postgresql":
+        return column + cast(literal(days), Integer)
+    return func.date(column, f"{days:+d} days")
+
+
+async def bulk_upsert_schedules(db: AsyncSession, rows: List[dict]) -> Optional[int]:
+    """
+    (date, start_time, location) 기준 일괄 upsert (INSERT 1회, 커밋은 호출자가 수행)
+
+    기존 일정의 정원을 현재 지원자 수보다 적게 바꾸는 항목은 갱신하지 않으며,
+    이런 항목이 있으면 None을 반환합니다 (호출자가 롤백).
+    """
+    if not rows:
+        return 0
+
+    # 한 문장 안에서 같은 슬롯이 두 번 갱신되지 않도록 마지막 항목만 유지
+    unique_rows = list({(row["date"], row["start_time"], row["location"] or ""): row for row in rows}.values())
+
+    stmt = _insert_for(db).values(unique_rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=SLOT_INDEX_ELEMENTS,
+        set_={
+            "title": stmt.excluded.title,
+            "description": stmt.excluded.description,
+            "end_time": stmt.excluded.end_time,
+            "capacity": stmt.excluded.capacity,
+            "updated_at": func.now(),
+        },
+        where=or_(stmt.excluded.capacity.is_(None), stmt.excluded.capacity >= Schedule.applicant_count),
+    )
+    result = await db.execute(stmt)
+    if result.rowcount < len(unique_rows):
+        return None
+    return result.rowcount
+
+
+def plan_clone(unit: str, source_start: date, target_start: date) -> List[Tuple[date, date, int]]:
+    """
+    복사 계획 [(원본 시작일, 원본 종료일, 이동 일수)]
+
+    월 단위 복사는 요일이 유지되도록 7일 배수만큼 이동하며, 원본 월이 대상 월을
+    모두 덮지 못하는 경우 마지막 주를 한 번 더 이동하여 채웁니다.
+    """
+    if unit == "week":
+        return [(source_start, source_start + timedelta(days=6), (target_start - source_start).days)]
+
+    source_first = source_start.replace(day=1)
+    source_last = source_first.replace(day=calendar.monthrange(source_first.year, source_first.month)[1])
+    target_first = target_start.replace(day=1)
+    target_last = target_first.replace(day=calendar.monthrange(target_first.year, target_first.month)[1])
+
+    base_shift = (target_first - source_first).days // 7 * 7
+    covered_until = target_first - timedelta(days=1)
+    passes = []
+    for shift in (base_shift, base_shift + 7):
+        lo = max(source_first, covered_until + timedelta(days=1 - shift))
+        hi = min(source_last, target_last - timedelta(days=shift))
+        if lo <= hi:
+            passes.append((lo, hi, shift))
+            covered_until = hi + timedelta(days=shift)
+    return passes
+
+
+async def clone_schedules(
+    db: AsyncSession,
+    plan: List[Tuple[date, date, int]],
+    created_by: int,
+) -> int:
+    """INSERT ... SELECT로 일정 복사, 이미 있는 슬롯은 건너뜀 (커밋은 호출자가 수행)"""
+    inserted = 0
+    for source_from, source_to, shift in plan:
+        source = select(
+            Schedule.title,
+            Schedule.description,
+            _shift_date(db, Schedule.date, shift),
+            Schedule.start_time,
+            Schedule.end_time,
+            Schedule.location,
+            Schedule.capacity,
+            literal(created_by),
+        ).where(Schedule.date >= source_from, Schedule.date <= source_to)
+
+        stmt = _insert_for(db).from_select(
+            ["title", "description", "date", "start_time", "end_time", "location", "capacity", "created_by"],
+            source,
+        ).on_conflict_do_nothing(index_elements=SLOT_INDEX_ELEMENTS)
+        result = await db.execute(stmt)
+        inserted += result.rowcount
+    return inserted
+
+
+async def _find_occurrence(db: AsyncSession, template_id: int, occurrence_date: date) -> Optional[Schedule]:
+    """이미 저장된 템플릿 회차"""
+    return await db.scalar(
+        select(Schedule).where(
+            Schedule.template_id == template_id,
+            Schedule.date == occurrence_date,
+        ).limit(1)
+    )
+
+
+async def get_schedule_by_id(db: AsyncSession, schedule_id: int) -> Optional[Schedule]:
+    """일정 조회 (가상 회차 ID는 저장된 회차가 있을 때만 반환, 새로 생성하지 않음)"""
+    occurrence = parse_occurrence_id(schedule_id)
+    if occurrence is None:
+        return await db.get(Schedule, schedule_id)
+    return await _find_occurrence(db, *occurrence)
+
+
+async def get_virtual_occurrence(db: AsyncSession, schedule_id: int) -> Optional[ScheduleResponse]:
+    """저장되지 않은 템플릿 회차의 응답 (유효하지 않은 ID면 None)"""
+    occurrence = parse_occurrence_id(schedule_id)
+    if occurrence is None:
+        return None
+
+    template_id, occurrence_date = occurrence
+    for item in await get_template_items(db):
+        if item["id"] == template_id and occurs_on(item, occurrence_date):
+            return ScheduleResponse(**occurrence_item(item, occurrence_date))
+    return None
+
+
+async def materialize_occurrence(db: AsyncSession, schedule_id: int) -> Optional[Schedule]:
+    """
+    가상 회차 ID에 해당하는 일정 행을 생성하고 반환 (커밋은 호출자가 수행)
+
+    같은 슬롯에 이미 일정이 있으면 그 일정을 반환하므로 동시 요청에서도
+    한 행만 생성됩니다. 일반 일정 ID는 그대로 조회합니다.
+    """
+    occurrence = parse_occurrence_id(schedule_id)
+    if occurrence is None:
+        return await db.get(Schedule, schedule_id)
+
+    template_id, occurrence_date = occurrence
+    schedule = await _find_occurrence(db, template_id, occurrence_date)
+    if schedule:
+        return schedule
+
+    template = await db.get(ScheduleTemplate, template_id)
+    if (
+        not template
+        or occurrence_date.weekday() != template.weekday
+        or occurrence_date < template.valid_from
+        or (template.valid_until and occurrence_date > template.valid_until)
+    ):
+        return None
+
+    skipped = await db.scalar(
+        select(ScheduleTemplateException.id).where(
+            ScheduleTemplateException.template_id == template_id,
+            ScheduleTemplateException.date == occurrence_date,
+        )
+    )
+    if skipped:
+        return None
+
+    await db.execute(
+        _insert_for(db).values(
+            title=template.title,
+            description=template.description,
+            date=occurrence_date,
+            start_time=template.start_time,
+            end_time=template.end_time,
+            location=template.location,
+            capacity=template.capacity,
+            template_id=template.id,
+            created_by=template.created_by,
+        ).on_conflict_do_nothing(index_elements=SLOT_INDEX_ELEMENTS)
+    )
+
+    return await db.scalar(
+        select(Schedule).where(
+            Schedule.date == occurrence_date,
+            Schedule.start_time == template.start_time,
+            Schedule.location == template.location,
+        )
+    )
+
+
+async def add_template_exception(db: AsyncSession, template_id: int, exception_date: date) -> None:
+    """템플릿 회차 제외 날짜 추가 (커밋 / 템플릿 캐시 무효화는 호출자가 수행)"""
+    await db.execute(
+        _insert_for(db, ScheduleTemplateException)
+        .values(template_id=template_id, date=exception_date)
+        .on_conflict_do_nothing(index_elements=["template_id", "date"])
+    )
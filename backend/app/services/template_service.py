@@ -0,0 +1,142 @@
+"""
+반복 일정 템플릿 서비스
+
+템플릿 회차는 저장하지 않고 조회 범위에 대해 즉석에서 계산합니다.
+아직 저장되지 않은 회차는 음수 ID(-(템플릿 ID * 10,000,000 + 날짜 서수))로
+표시되며, 지원 / 수정 시 이 ID로 실제 일정 행을 생성합니다.
+템플릿 목록과 제외 날짜는 한 번에 캐시되며 템플릿 변경 시 무효화됩니다.
+"""
+
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.schedule_template import ScheduleTemplate, ScheduleTemplateException
+from app.schemas.schedule import ScheduleTemplateResponse
+from app.services.cache import cache
+from app.utils.http_cache import bump_versions
+
+TEMPLATES_CACHE_KEY = "schedules:templates"
+
+# 날짜 서수(date.toordinal)가 차지하는 자리수 (9999-12-31 = 3,652,059)
+_OCCURRENCE_ID_BASE = 10_000_000
+
+
+def occurrence_id(template_id: int, occurrence_date: date) -> int:
+    """저장되지 않은 회차의 가상 일정 ID"""
+    return -(template_id * _OCCURRENCE_ID_BASE + occurrence_date.toordinal())
+
+
+def parse_occurrence_id(schedule_id: int) -> Optional[Tuple[int, date]]:
+    """가상 일정 ID를 (템플릿 ID, 날짜)로 변환 (가상 ID가 아니면 None)"""
+    if schedule_id >= 0:
+        return None
+    template_id, ordinal = divmod(-schedule_id, _OCCURRENCE_ID_BASE)
+    if template_id == 0 or not 1 <= ordinal <= date.max.toordinal():
+        return None
+    return template_id, date.fromordinal(ordinal)
+
+
+async def get_template_items(db: AsyncSession) -> List[dict]:
+    """템플릿 목록과 제외 날짜 (캐시, 쿼리 2회)"""
+    items = await cache.get(TEMPLATES_CACHE_KEY)
+    if items is not None:
+        return items
+
+    templates = (await db.scalars(select(ScheduleTemplate).order_by(ScheduleTemplate.id))).all()
+    exception_rows = (await db.execute(
+        select(ScheduleTemplateException.template_id, ScheduleTemplateException.date)
+    )).all()
+
+    exceptions = {}
+    for template_id, exception_date in exception_rows:
+        exceptions.setdefault(template_id, []).append(exception_date.isoformat())
+
+    items = [
+        {
+            **ScheduleTemplateResponse.from_orm_with_mapping(template).model_dump(mode="json"),
+            "exceptions": exceptions.get(template.id, []),
+        }
+        for template in templates
+    ]
+    await cache.set(TEMPLATES_CACHE_KEY, items)
+    return items
+
+
+async def invalidate_templates() -> None:
+    await cache.delete(TEMPLATES_CACHE_KEY)
+    await bump_versions(TEMPLATES_CACHE_KEY)
+
+
+def occurs_on(item: dict, target_date: date) -> bool:
+    """템플릿이 해당 날짜에 회차를 갖는지 여부 (제외 날짜 포함)"""
+    if target_date.weekday() != item["weekday"]:
+        return False
+    if target_date < date.fromisoformat(item["validFrom"]):
+        return False
+    if item["validUntil"] and target_date > date.fromisoformat(item["validUntil"]):
+        return False
+    return target_date.isoformat() not in item["exceptions"]
+
+
+def occurrence_item(item: dict, occurrence_date: date) -> dict:
+    """템플릿 회차를 일정 응답 형태로 변환"""
+    return {
+        "id": occurrence_id(item["id"], occurrence_date),
+        "title": item["title"],
+        "description": item["description"],
+        "date": occurrence_date.isoformat(),
+        "startTime": item["startTime"],
+        "endTime": item["endTime"],
+        "location": item["location"],
+        "capacity": item["capacity"],
+        "createdBy": item["createdBy"],
+        "createdAt": item["createdAt"],
+        "applicantCount": 0,
+        "isApplied": False,
+        "templateId": item["id"],
+    }
+
+
+def expand_templates(
+    items: List[dict],
+    start_date: date,
+    end_date: date,
+    concrete_items: Iterable[dict],
+) -> List[dict]:
+    """
+    [start_date, end_date) 범위의 템플릿 회차 계산
+
+    이미 저장된 회차(같은 템플릿 / 날짜)나 같은 슬롯(날짜 / 시작 시간 / 장소)에
+    일정이 있는 회차는 제외합니다.
+    """
+    taken_occurrences = set()
+    taken_slots = set()
+    for concrete in concrete_items:
+        taken_slots.add((concrete["date"], concrete["startTime"], concrete["location"]))
+        if concrete.get("templateId"):
+            taken_occurrences.add((concrete["templateId"], concrete["date"]))
+
+    occurrences = []
+    last_date = end_date - timedelta(days=1)
+    for item in items:
+        first = max(start_date, date.fromisoformat(item["validFrom"]))
+        last = last_date
+        if item["validUntil"]:
+            last = min(last, date.fromisoformat(item["validUntil"]))
+
+        skipped = set(item["exceptions"])
+        current = first + timedelta(days=(item["weekday"] - first.weekday()) % 7)
+        while current <= last:
+            iso = current.isoformat()
+            if (
+                iso not in skipped
+                and (item["id"], iso) not in taken_occurrences
+                and (iso, item["startTime"], item["location"]) not in taken_slots
+            ):
+                occurrences.append(occurrence_item(item, current))
+            current += timedelta(days=7)
+
+    return occurrences
@@ -1,18 +1,57 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.utils.security import verify_access_token
+from app.services.cache import MemoryCache
+from app.utils.security import Principal, get_access_principal, verify_access_token
 
 security = HTTPBearer()
 
+# 인증된 사용자 캐시 (프로세스 내부, 짧은 TTL)
+# 캐시된 User는 세션에서 분리된 읽기 전용 객체이므로, 사용자 정보를 수정하는
+# 엔드포인트는 현재 세션에서 다시 조회하거나 UPDATE 문을 사용해야 합니다.
+principal_cache = MemoryCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    default_ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def _principal_key(user_id: int) -> str:
+    return f"principal:{user_id}"
+
+
+async def _load_principal(db: AsyncSession, user_id: int) -> Optional[User]:
+    """캐시 또는 DB에서 인증 사용자 조회"""
+    key = _principal_key(user_id)
+    user = await principal_cache.get(key)
+    if user is not None:
+        return user
+
+    user = await db.get(User, user_id)
+    if user is not None:
+        db.expunge(user)
+        await principal_cache.set(key, user)
+    return user
+
+
+async def invalidate_principal(user_id: int) -> None:
+    """사용자 정보 변경 시 캐시 무효화"""
+    await principal_cache.delete(_principal_key(user_id))
+
+
+@event.listens_for(User, "after_delete")
+def _discard_deleted_principal(mapper, connection, target):
+    principal_cache.discard(_principal_key(target.id))
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """현재 로그인한 사용자 가져오기"""
     token = credentials.credentials
@@ -25,7 +64,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await _load_principal(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,7 +77,7 @@ async def get_current_user(
 
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     """현재 로그인한 사용자 가져오기 (선택적)"""
     if credentials is None:
@@ -50,17 +89,42 @@ async def get_current_user_optional(
     if user_id is None:
         return None
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await _load_principal(db, user_id)
     return user
 
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """현재 관리자 가져오기"""
-    if current_user.role != UserRole.ADMIN:
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """
+    현재 관리자 가져오기
+
+    토큰 서명은 검증 캐시로 확인하고, 역할은 토큰 클레임 대신 인증 사용자
+    캐시(PRINCIPAL_CACHE_TTL_SECONDS) 또는 DB로 확인합니다. 강등된 관리자의 토큰은
+    만료 전이라도 캐시 TTL 이내에 권한을 잃습니다.
+    """
+    principal = get_access_principal(credentials.credentials)
+
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 정보입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = await _load_principal(db, principal.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="사용자를 찾을 수 없습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    role = user.role.value if hasattr(user.role, 'value') else user.role
+    if role != UserRole.ADMIN.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다.",
         )
-    return current_user
+    return Principal(id=user.id, role=role, name=user.name)
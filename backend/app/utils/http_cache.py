@@ -0,0 +1,90 @@
+"""
+조건부 GET (ETag / Last-Modified) 유틸
+
+컬렉션별 버전(나노초 타임스탬프)을 캐시에 저장하고 쓰기 API가 이를
+갱신합니다. 조회 API는 버전으로 ETag를 만들고, If-None-Match가 일치하면
+DB를 조회하지 않고 304를 반환합니다. 버전이 캐시에서 사라지면 새 버전이
+만들어지므로 클라이언트는 한 번 더 내려받게 됩니다.
+
+Redis(공유 캐시)를 쓰면 모든 인스턴스가 같은 버전을 보므로 쓰기 직후부터
+새 데이터를 받습니다. 프로세스 내부 캐시에서는 다른 인스턴스 / 워커의 쓰기로
+버전이 갱신되지 않으므로, 버전 유지 시간을 CACHE_TTL_SECONDS로 제한합니다.
+이 경우 다른 인스턴스의 쓰기는 최대 CACHE_TTL_SECONDS 뒤에 반영되며, 이는
+프로세스 내부 월별 일정 캐시의 지연 범위와 같습니다.
+"""
+
+import hashlib
+import time
+from email.utils import formatdate
+from typing import List, Optional
+
+from fastapi import Request, Response, status
+
+from app.config import settings
+from app.services.cache import cache
+
+VERSION_KEY_PREFIX = "version:"
+VERSION_TTL_SECONDS = 24 * 60 * 60  # 공유 캐시(Redis)에서의 버전 유지 시간
+
+
+def version_ttl() -> int:
+    """버전 유지 시간 (공유 캐시가 아니면 CACHE_TTL_SECONDS로 제한)"""
+    if cache.shared:
+        return VERSION_TTL_SECONDS
+    return min(VERSION_TTL_SECONDS, settings.CACHE_TTL_SECONDS)
+
+
+async def get_versions(*names: str) -> List[int]:
+    """컬렉션 버전 조회 (없으면 새로 생성)"""
+    versions = []
+    for name in names:
+        key = VERSION_KEY_PREFIX + name
+        version = await cache.get(key, track=False)
+        if version is None:
+            version = time.time_ns()
+            await cache.set(key, version, ttl=version_ttl())
+        versions.append(version)
+    return versions
+
+
+async def bump_versions(*names: str) -> None:
+    """쓰기 후 컬렉션 버전 갱신 (커밋 이후에 호출)"""
+    version = time.time_ns()
+    for name in names:
+        await cache.set(VERSION_KEY_PREFIX + name, version, ttl=version_ttl())
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두어는 무시
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    version_names: List[str],
+    *scope: object,
+) -> Optional[Response]:
+    """
+    ETag / Last-Modified 헤더 설정 후, 클라이언트 사본이 최신이면 304 응답 반환
+
+    scope에는 응답 내용이 달라지는 값(사용자 ID 등)을 넣습니다.
+    """
+    versions = await get_versions(*version_names)
+    digest = hashlib.sha1(":".join(str(part) for part in (*versions, *scope)).encode()).hexdigest()
+    headers = {
+        "ETag": f'W/"{digest[:32]}"',
+        "Last-Modified": formatdate(max(versions) / 1_000_000_000, usegmt=True),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
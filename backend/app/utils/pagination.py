@@ -0,0 +1,40 @@
+"""
+커서(keyset) 페이지네이션 유틸
+
+커서는 정렬 키 값 목록을 JSON으로 직렬화한 뒤 URL-safe base64로 인코딩한
+불투명 문자열입니다.
+"""
+
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Any, Callable, List
+
+from fastapi import HTTPException, status
+
+
+def _json_default(value: Any):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"커서에 사용할 수 없는 값입니다: {value!r}")
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 커서 문자열로 인코딩"""
+    raw = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> List[Any]:
+    """커서 문자열을 디코딩하고 각 값을 parsers로 변환"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다.",
+        )
@@ -0,0 +1,103 @@
+"""
+데이터베이스 커넥션 풀 통계
+
+SQLAlchemy 풀 이벤트(connect / checkout / checkin / invalidate)와
+커넥션 대기 시간을 수집하여 관리자 API에서 조회할 수 있도록 합니다.
+"""
+
+import time
+from collections import deque
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolStats:
+    """커넥션 풀 누적 통계"""
+
+    def __init__(self, sample_size: int = 1000):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._wait_samples = deque(maxlen=sample_size)
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_count += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self._wait_samples.append(seconds)
+
+    def attach(self, pool: Pool) -> None:
+        """풀 이벤트 리스너 등록"""
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.invalidations += 1
+
+    def snapshot(self, pool: Optional[Pool] = None) -> dict:
+        """현재 풀 상태와 누적 통계"""
+        samples = sorted(self._wait_samples)
+        p95 = samples[int(len(samples) * 0.95) - 1] if samples else 0.0
+
+        result = {
+            "checkedOut": None,
+            "idle": None,
+            "overflow": None,
+            "poolSize": None,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "waitCount": self.wait_count,
+            "waitAvgMs": round(self.wait_total / self.wait_count * 1000, 3) if self.wait_count else 0.0,
+            "waitP95Ms": round(p95 * 1000, 3),
+            "waitMaxMs": round(self.wait_max * 1000, 3),
+        }
+
+        # QueuePool 계열에서만 제공되는 현재 상태
+        if pool is not None and hasattr(pool, "checkedout"):
+            result.update(
+                checkedOut=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                poolSize=pool.size(),
+            )
+
+        return result
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 획득 대기 시간을 기록하는 큐 풀"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - started)
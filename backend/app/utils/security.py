@@ -1,11 +1,47 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비용(rounds)이 설정값과 다른 해시는 로그인 시 재해싱 대상이 됩니다
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt 연산 전용 워커 풀 (이벤트 루프 블로킹 방지)
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_pending_hash_tasks = 0
+
+
+class PasswordHasherBusy(Exception):
+    """비밀번호 해싱 대기열이 가득 찬 경우"""
+
+
+@dataclass(frozen=True)
+class Principal:
+    """액세스 토큰 클레임으로 확인한 사용자"""
+    id: int
+    role: Optional[str] = None
+    name: Optional[str] = None
+
+
+# 검증이 끝난 액세스 토큰 캐시 (토큰 digest -> (만료 시각, Principal))
+_verified_tokens: "OrderedDict[str, tuple]" = OrderedDict()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -18,14 +54,51 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(user_id: int) -> str:
-    """액세스 토큰 생성"""
+async def _run_hash_task(func, *args):
+    """bcrypt 연산을 워커 풀에서 실행 (대기열 한도 초과 시 PasswordHasherBusy)"""
+    global _pending_hash_tasks
+
+    if _pending_hash_tasks >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHasherBusy()
+
+    _pending_hash_tasks += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _pending_hash_tasks -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (워커 풀)"""
+    return await _run_hash_task(pwd_context.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 (워커 풀)
+
+    Returns:
+        (검증 성공 여부, 비용 설정이 바뀐 경우 새 해시 / 아니면 None)
+    """
+    return await _run_hash_task(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+def create_access_token(user_id: int, role: Optional[str] = None, name: Optional[str] = None) -> str:
+    """액세스 토큰 생성 (role / name 클레임 포함)"""
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode = {
         "sub": str(user_id),
         "exp": expire,
         "type": "access"
     }
+    if role is not None:
+        to_encode["role"] = role.value if hasattr(role, 'value') else role
+    if name is not None:
+        to_encode["name"] = name
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -51,19 +124,46 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
-def verify_access_token(token: str) -> Optional[int]:
-    """액세스 토큰 검증 및 user_id 반환"""
+def get_access_principal(token: str) -> Optional[Principal]:
+    """액세스 토큰 검증 및 Principal 반환 (검증 결과는 만료 시각까지 캐시)"""
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    now = time.time()
+
+    cached = _verified_tokens.get(digest)
+    if cached is not None:
+        expires_at, principal = cached
+        if expires_at > now:
+            _verified_tokens.move_to_end(digest)
+            return principal
+        del _verified_tokens[digest]
+
     payload = decode_token(token)
     if payload is None:
         return None
     if payload.get("type") != "access":
         return None
     try:
-        user_id = int(payload.get("sub"))
-        return user_id
-    except (TypeError, ValueError):
+        principal = Principal(
+            id=int(payload.get("sub")),
+            role=payload.get("role"),
+            name=payload.get("name"),
+        )
+        expires_at = float(payload["exp"])
+    except (KeyError, TypeError, ValueError):
         return None
 
+    _verified_tokens[digest] = (expires_at, principal)
+    while len(_verified_tokens) > settings.TOKEN_CACHE_MAX_ENTRIES:
+        _verified_tokens.popitem(last=False)
+
+    return principal
+
+
+def verify_access_token(token: str) -> Optional[int]:
+    """액세스 토큰 검증 및 user_id 반환"""
+    principal = get_access_principal(token)
+    return principal.id if principal else None
+
 
 def verify_refresh_token(token: str) -> Optional[int]:
     """리프레시 토큰 검증 및 user_id 반환"""
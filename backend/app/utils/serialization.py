@@ -0,0 +1,112 @@
+"""
+목록 API용 빠른 직렬화
+
+자주 호출되는 목록 API는 ORM 객체와 pydantic 모델을 거치지 않고, 필요한
+컬럼만 조회한 행을 응답 형태의 dict로 바꾼 뒤 바로 JSON으로 인코딩합니다.
+키 이름과 값 형식은 각 *Response 스키마와 같습니다. orjson이 설치되어 있으면
+사용하고, 없으면 표준 json으로 대체합니다.
+"""
+
+import enum
+import json
+from datetime import date, datetime, time
+from typing import Any, Optional
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(value: Any):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {value!r}")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default)
+    return json.dumps(content, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(Response):
+    """검증 없이 바로 인코딩하는 JSON 응답"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """빠른 JSON 응답 생성 (response에 설정된 ETag / 커서 등의 헤더를 함께 전달)"""
+    return FastJSONResponse(content, headers=dict(response.headers) if response is not None else None)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def schedule_item(row, is_applied: Optional[bool] = None) -> dict:
+    """일정 행 -> ScheduleResponse 형태 (캐시에 저장할 수 있도록 날짜 / 시간은 문자열)"""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "date": row.date.isoformat(),
+        "startTime": row.start_time.isoformat(),
+        "endTime": row.end_time.isoformat(),
+        "location": row.location,
+        "capacity": row.capacity,
+        "createdBy": row.created_by,
+        "createdAt": _isoformat(row.created_at),
+        "applicantCount": row.applicant_count,
+        "isApplied": is_applied,
+        "templateId": row.template_id,
+    }
+
+
+def application_item(row, schedule: Optional[dict] = None, user: Optional[dict] = None) -> dict:
+    """지원 행 -> ApplicationResponse 형태"""
+    return {
+        "id": row.application_id,
+        "userId": row.user_id,
+        "scheduleId": row.schedule_id,
+        "status": row.status.value if hasattr(row.status, "value") else row.status,
+        "appliedAt": row.applied_at,
+        "cancelledAt": row.cancelled_at,
+        "schedule": schedule,
+        "user": user,
+    }
+
+
+def notice_item(row) -> dict:
+    """공지 행 -> NoticeResponse 형태"""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "content": row.content,
+        "isImportant": bool(row.is_important),
+        "createdBy": row.created_by,
+        "createdAt": row.created_at,
+        "updatedAt": row.updated_at,
+        "author": None,
+    }
+
+
+def notification_item(row) -> dict:
+    """알림 행 -> NotificationResponse 형태"""
+    return {
+        "id": row.id,
+        "userId": row.user_id,
+        "title": row.title,
+        "body": row.body,
+        "type": row.type.value if hasattr(row.type, "value") else row.type,
+        "isRead": row.is_read,
+        "createdAt": row.created_at,
+    }
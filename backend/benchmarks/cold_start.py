@@ -0,0 +1,58 @@
+"""
+서버 콜드 스타트 시간 측정
+
+uvicorn 프로세스를 띄우고 /health가 200을 반환할 때까지의 시간을 측정합니다.
+마이그레이션이 끝난 DB를 대상으로 실행합니다 (서버는 시작 시 스키마를 만들지 않음).
+
+    cd backend && python -m benchmarks.cold_start --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def measure(port: int, timeout: float) -> float:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=os.environ.copy(),
+    )
+    started = time.perf_counter()
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"서버가 시작 중 종료되었습니다 (exit code {process.returncode})")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            time.sleep(0.02)
+        raise RuntimeError(f"{timeout}초 안에 /health 응답이 없습니다")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    results = [measure(args.port, args.timeout) for _ in range(args.runs)]
+    print(f"runs={args.runs}")
+    print(f"time to /health: p50 {statistics.median(results) * 1000:.0f} ms, "
+          f"min {min(results) * 1000:.0f} ms, max {max(results) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
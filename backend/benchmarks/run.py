@@ -0,0 +1,414 @@
+"""
+API 부하 벤치마크
+
+가상 사용자 N명이 실제 트래픽 구성에 맞춰 API를 호출하고, 엔드포인트별
+처리량과 p50 / p95 / p99 응답 시간을 JSON으로 저장합니다. 커밋 간 비교는
+--compare로 합니다.
+
+시나리오
+    mixed         월별 달력 / 날짜별 일정 / 공지 페이지 / 내 지원 내역 / 안 읽은 알림 수
+                  (클라이언트별 ETag를 보관해 If-None-Match로 재검증)
+    slot-opening  모든 사용자가 같은 일정 몇 개에 동시에 지원한 뒤 취소 (반복)
+    login-storm   모든 사용자가 동시에 로그인 (반복)
+    auth          인증 없는 /health와 인증이 필요한 /auth/me를 번갈아 호출해
+                  요청당 인증 비용(p50 / p95 차이)을 측정 (토큰 검증 캐시 / 인증 사용자 캐시 포함)
+
+대상
+    기본값은 앱을 프로세스 안에서 호출합니다 (httpx ASGITransport, 네트워크 없음).
+    --base-url을 지정하면 실행 중인 서버(uvicorn 등)를 호출합니다.
+    마이그레이션과 데이터 준비(python -m app.commands.seed)가 끝난 DB를
+    사용하며, 벤치마크 사용자가 없으면 회원가입으로 만듭니다.
+
+    cd backend && python -m app.commands.seed --preset medium --reset
+    python -m benchmarks.run --concurrency 50 --duration 30 --output before.json
+    python -m benchmarks.run --base-url http://localhost:8000 --scenarios mixed
+    python -m benchmarks.run --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import time
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
+SCENARIOS = ("mixed", "slot-opening", "login-storm", "auth")
+
+# mixed 시나리오의 요청 비율 (가중치)
+MIXED_WEIGHTS = {
+    "calendar": 45,
+    "by-date": 25,
+    "notices": 15,
+    "my-applications": 10,
+    "unread-count": 5,
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """최근접 순위 방식 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Recorder:
+    """엔드포인트별 응답 시간 / 상태 코드 집계"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    async def request(self, client: httpx.AsyncClient, label: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            self.latencies[label].append(time.perf_counter() - started)
+            self.statuses[label][type(exc).__name__] += 1
+            return None
+        self.latencies[label].append(time.perf_counter() - started)
+        self.statuses[label][str(response.status_code)] += 1
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for label, values in sorted(self.latencies.items()):
+            values.sort()
+            statuses = dict(self.statuses[label])
+            errors = sum(count for code, count in statuses.items() if not code.isdigit() or int(code) >= 500)
+            endpoints[label] = {
+                "count": len(values),
+                "errors": errors,
+                "statusCounts": statuses,
+                "throughput": round(len(values) / elapsed, 2),
+                "meanMs": round(sum(values) / len(values) * 1000, 2),
+                "p50Ms": round(percentile(values, 50) * 1000, 2),
+                "p95Ms": round(percentile(values, 95) * 1000, 2),
+                "p99Ms": round(percentile(values, 99) * 1000, 2),
+                "maxMs": round(values[-1] * 1000, 2),
+            }
+        total = sum(endpoint["count"] for endpoint in endpoints.values())
+        return {
+            "durationSeconds": round(elapsed, 2),
+            "requests": total,
+            "throughput": round(total / elapsed, 2) if elapsed else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+class VirtualUser:
+    def __init__(self, index: int, email: str, password: str, seed: int):
+        self.index = index
+        self.email = email
+        self.password = password
+        self.token: Optional[str] = None
+        self.etags: Dict[str, str] = {}
+        self.random = random.Random(seed + index)
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    async def login(self, client: httpx.AsyncClient, recorder: Optional[Recorder] = None) -> bool:
+        body = {"email": self.email, "password": self.password}
+        if recorder:
+            response = await recorder.request(client, "POST /auth/login", "POST", "/api/auth/login", json=body)
+        else:
+            response = await client.post("/api/auth/login", json=body)
+        if response is None or response.status_code != 200:
+            return False
+        self.token = response.json()["accessToken"]
+        return True
+
+    async def conditional_get(self, client: httpx.AsyncClient, recorder: Recorder, label: str, url: str, params: dict):
+        """ETag를 보관했다가 If-None-Match로 재검증 (브라우저 동작과 동일)"""
+        key = url + "?" + "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+        headers = dict(self.headers)
+        if key in self.etags:
+            headers["If-None-Match"] = self.etags[key]
+        response = await recorder.request(client, label, "GET", url, params=params, headers=headers)
+        if response is not None and response.status_code == 200 and "etag" in response.headers:
+            self.etags[key] = response.headers["etag"]
+        return response
+
+
+async def prepare_users(client: httpx.AsyncClient, args) -> List[VirtualUser]:
+    """벤치마크 사용자 로그인 (없으면 회원가입)"""
+    users = [
+        VirtualUser(i, args.email_pattern.format(i=i), args.password, args.seed)
+        for i in range(args.concurrency)
+    ]
+    semaphore = asyncio.Semaphore(8)
+
+    async def prepare(user: VirtualUser):
+        async with semaphore:
+            if await user.login(client):
+                return
+            response = await client.post("/api/auth/register", json={
+                "email": user.email,
+                "password": user.password,
+                "name": f"벤치마크{user.index}",
+            })
+            response.raise_for_status()
+            user.token = response.json()["accessToken"]
+
+    await asyncio.gather(*(prepare(user) for user in users))
+    return users
+
+
+async def run_mixed(client: httpx.AsyncClient, users: List[VirtualUser], args) -> dict:
+    recorder = Recorder()
+    labels = list(MIXED_WEIGHTS)
+    weights = list(MIXED_WEIGHTS.values())
+    month_days = [date(args.year, args.month, day) for day in range(1, 29)]
+    deadline = time.perf_counter() + args.duration
+
+    async def loop(user: VirtualUser):
+        notice_cursor = None
+        while time.perf_counter() < deadline:
+            action = user.random.choices(labels, weights)[0]
+            if action == "calendar":
+                await user.conditional_get(client, recorder, "GET /schedules", "/api/schedules",
+                                           {"year": args.year, "month": args.month})
+            elif action == "by-date":
+                target = user.random.choice(month_days).isoformat()
+                await user.conditional_get(client, recorder, "GET /schedules/by-date", "/api/schedules/by-date",
+                                           {"date": target})
+            elif action == "notices":
+                params = {"pageSize": 10}
+                if notice_cursor:
+                    params["cursor"] = notice_cursor
+                response = await recorder.request(client, "GET /notices", "GET", "/api/notices",
+                                                  params=params, headers=user.headers)
+                # 첫 페이지부터 몇 페이지 넘겨본 뒤 다시 처음으로
+                if response is not None and response.status_code == 200 and user.random.random() < 0.6:
+                    notice_cursor = response.json().get("nextCursor")
+                else:
+                    notice_cursor = None
+            elif action == "my-applications":
+                await recorder.request(client, "GET /applications/my", "GET", "/api/applications/my",
+                                       headers=user.headers)
+            else:
+                await recorder.request(client, "GET /notifications/unread-count", "GET",
+                                       "/api/notifications/unread-count", headers=user.headers)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(user) for user in users))
+    return recorder.summary(time.perf_counter() - started)
+
+
+async def run_slot_opening(client: httpx.AsyncClient, users: List[VirtualUser], args) -> dict:
+    recorder = Recorder()
+    response = await client.get("/api/schedules", params={"year": args.year, "month": args.month},
+                                headers=users[0].headers)
+    response.raise_for_status()
+    schedule_ids = [item["id"] for item in response.json() if item["id"] > 0]
+    if not schedule_ids:
+        raise SystemExit(f"{args.year}-{args.month:02d}에 일정이 없습니다 (slot-opening)")
+    targets = random.Random(args.seed).sample(schedule_ids, min(args.slot_schedules, len(schedule_ids)))
+
+    async def apply_and_cancel(user: VirtualUser, schedule_id: int):
+        await recorder.request(client, "POST /applications/{id}", "POST", f"/api/applications/{schedule_id}",
+                               headers=user.headers)
+        await recorder.request(client, "DELETE /applications/{id}", "DELETE", f"/api/applications/{schedule_id}",
+                               headers=user.headers)
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    rounds = 0
+    while time.perf_counter() < deadline:
+        # 모든 사용자가 같은 순간에 몇 개 일정에 몰림
+        await asyncio.gather(*(
+            apply_and_cancel(user, targets[user.index % len(targets)]) for user in users
+        ))
+        rounds += 1
+
+    summary = recorder.summary(time.perf_counter() - started)
+    summary["rounds"] = rounds
+    summary["scheduleIds"] = targets
+    return summary
+
+
+async def run_login_storm(client: httpx.AsyncClient, users: List[VirtualUser], args) -> dict:
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    rounds = 0
+    while time.perf_counter() < deadline:
+        await asyncio.gather(*(user.login(client, recorder) for user in users))
+        rounds += 1
+
+    summary = recorder.summary(time.perf_counter() - started)
+    summary["rounds"] = rounds
+    return summary
+
+
+async def run_auth(client: httpx.AsyncClient, users: List[VirtualUser], args) -> dict:
+    recorder = Recorder()
+    deadline = time.perf_counter() + args.duration
+
+    async def loop(user: VirtualUser):
+        while time.perf_counter() < deadline:
+            await recorder.request(client, "GET /health", "GET", "/health")
+            await recorder.request(client, "GET /auth/me", "GET", "/api/auth/me", headers=user.headers)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(user) for user in users))
+    summary = recorder.summary(time.perf_counter() - started)
+
+    baseline = summary["endpoints"].get("GET /health")
+    authenticated = summary["endpoints"].get("GET /auth/me")
+    if baseline and authenticated:
+        summary["authOverheadMs"] = {
+            "p50": round(authenticated["p50Ms"] - baseline["p50Ms"], 2),
+            "p95": round(authenticated["p95Ms"] - baseline["p95Ms"], 2),
+        }
+    return summary
+
+
+RUNNERS = {
+    "mixed": run_mixed,
+    "slot-opening": run_slot_opening,
+    "login-storm": run_login_storm,
+    "auth": run_auth,
+}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    timeout = httpx.Timeout(args.timeout)
+
+    app = None
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout)
+    else:
+        from app.main import app
+
+        # ASGITransport는 startup / shutdown 이벤트를 보내지 않으므로 직접 실행
+        await app.router.startup()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://benchmark",
+            limits=limits,
+            timeout=timeout,
+        )
+
+    try:
+        users = await prepare_users(client, args)
+        results = {}
+        for name in args.scenarios:
+            print(f"[{name}] 실행 중 ({args.duration:.0f}초, 사용자 {len(users)}명)")
+            results[name] = await RUNNERS[name](client, users, args)
+    finally:
+        await client.aclose()
+        if app is not None:
+            await app.router.shutdown()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "startedAt": datetime.now(timezone.utc).isoformat(),
+            "target": args.base_url or "asgi",
+            "concurrency": args.concurrency,
+            "durationSeconds": args.duration,
+            "seed": args.seed,
+            "year": args.year,
+            "month": args.month,
+            "python": platform.python_version(),
+        },
+        "scenarios": results,
+    }
+
+
+def print_summary(result: dict) -> None:
+    for name, scenario in result["scenarios"].items():
+        print(f"\n[{name}] {scenario['requests']} requests, {scenario['throughput']} req/s")
+        print(f"  {'endpoint':<34}{'count':>8}{'err':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for label, endpoint in scenario["endpoints"].items():
+            print(
+                f"  {label:<34}{endpoint['count']:>8}{endpoint['errors']:>6}{endpoint['throughput']:>9}"
+                f"{endpoint['p50Ms']:>9}{endpoint['p95Ms']:>9}{endpoint['p99Ms']:>9}"
+            )
+        if "authOverheadMs" in scenario:
+            overhead = scenario["authOverheadMs"]
+            print(f"  인증 비용 (요청당): p50 {overhead['p50']} ms, p95 {overhead['p95']} ms")
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """두 결과 파일의 엔드포인트별 처리량 / p95 / p99 변화율 출력"""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    def change(old: float, new: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"before: {before['meta'].get('commit')}  after: {after['meta'].get('commit')}")
+    for name, scenario in after["scenarios"].items():
+        old_scenario = before["scenarios"].get(name)
+        if not old_scenario:
+            continue
+        print(f"\n[{name}] throughput {change(old_scenario['throughput'], scenario['throughput'])}")
+        print(f"  {'endpoint':<34}{'req/s':>10}{'p95':>10}{'p99':>10}")
+        for label, endpoint in scenario["endpoints"].items():
+            old = old_scenario["endpoints"].get(label)
+            if not old:
+                continue
+            print(
+                f"  {label:<34}{change(old['throughput'], endpoint['throughput']):>10}"
+                f"{change(old['p95Ms'], endpoint['p95Ms']):>10}{change(old['p99Ms'], endpoint['p99Ms']):>10}"
+            )
+
+
+def main() -> None:
+    today = date.today()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="지정 시 실행 중인 서버 호출 (기본: 프로세스 안 ASGI 호출)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"쉼표로 구분 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--concurrency", type=int, default=50, help="가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="시나리오별 실행 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--year", type=int, default=today.year)
+    parser.add_argument("--month", type=int, default=today.month)
+    parser.add_argument("--slot-schedules", type=int, default=3, help="slot-opening에서 동시에 몰리는 일정 수")
+    parser.add_argument("--email-pattern", default="bench{i}@example.com", help="벤치마크 사용자 이메일 ({i}: 번호)")
+    parser.add_argument("--password", default="benchmark-password")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="두 결과 파일 비교")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+    result = asyncio.run(run(args))
+    print_summary(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+목록 응답 직렬화 벤치마크
+
+pydantic 경로(from_orm_with_mapping -> response_model 검증 -> JSON)와
+빠른 경로(컬럼 행 -> dict -> orjson)의 1,000행당 직렬화 시간을 비교합니다.
+DB 없이 메모리에서 만든 행으로 측정하므로 순수 직렬화 비용만 나타납니다.
+
+    cd backend && python -m benchmarks.serialization --rows 1000 --repeat 30
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.schemas.notice import NoticeResponse
+from app.schemas.notification import NotificationResponse
+from app.schemas.schedule import ScheduleResponse
+from app.utils import serialization
+from app.utils.serialization import dumps, notice_item, notification_item, schedule_item
+
+
+def make_schedules(count: int) -> list:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"전시대 봉사 {i}",
+            description="장안 전시대",
+            date=date(2026, 1, 1) + timedelta(days=i % 365),
+            start_time=dtime(9, 30),
+            end_time=dtime(12, 0),
+            location="씨젠" if i % 2 else "이화수",
+            capacity=6,
+            created_by=1,
+            created_at=base + timedelta(minutes=i),
+            applicant_count=i % 6,
+            template_id=None,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_notices(count: int) -> list:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"공지 {i}",
+            content="봉사 일정 안내입니다. " * 10,
+            is_important=i % 10 == 0,
+            created_by=1,
+            created_at=base + timedelta(minutes=i),
+            updated_at=base + timedelta(minutes=i),
+            author=None,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_notifications(count: int) -> list:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            user_id=1,
+            title="봉사 일정 리마인더",
+            body=f"내일 '전시대 봉사 {i}' 봉사가 예정되어 있습니다.",
+            type="reminder",
+            is_read=i % 3 == 0,
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def pydantic_path(model, build, rows) -> bytes:
+    """기존 경로: 행마다 모델 생성 후 FastAPI와 같이 response_model로 재검증 / 직렬화"""
+    adapter = TypeAdapter(List[model])
+    content = [build(row) for row in rows]
+    validated = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(
+        adapter.dump_python(validated, mode="json"),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+def fast_path(item, rows) -> bytes:
+    return dumps([item(row) for row in rows])
+
+
+def measure(fn, repeat: int) -> float:
+    fn()  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            "schedules",
+            make_schedules(args.rows),
+            ScheduleResponse,
+            lambda row: ScheduleResponse.from_orm_with_mapping(row, applicant_count=row.applicant_count),
+            schedule_item,
+        ),
+        ("notices", make_notices(args.rows), NoticeResponse, NoticeResponse.from_orm_with_mapping, notice_item),
+        (
+            "notifications",
+            make_notifications(args.rows),
+            NotificationResponse,
+            NotificationResponse.from_orm_with_mapping,
+            notification_item,
+        ),
+    ]
+
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    print(f"rows={args.rows} repeat={args.repeat} encoder={encoder}")
+    print(f"{'endpoint':<14}{'pydantic ms/1k':>16}{'fast ms/1k':>12}{'speedup':>9}")
+
+    scale = 1000 / args.rows * 1000
+    for name, rows, model, build, item in cases:
+        slow = measure(lambda: pydantic_path(model, build, rows), args.repeat) * scale
+        fast = measure(lambda: fast_path(item, rows), args.repeat) * scale
+        print(f"{name:<14}{slow:>16.2f}{fast:>12.2f}{slow / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
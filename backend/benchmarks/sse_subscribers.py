@@ -0,0 +1,130 @@
+"""
+일정 실시간 이벤트(SSE) 유휴 구독자 부하 테스트
+
+broker 모드 (기본): 프로세스 안에서 구독자 N개를 만들어 구독자당 메모리와
+이벤트 1건이 모든 구독자에게 전달되는 시간(fan-out)을 측정합니다.
+
+    cd backend && python -m benchmarks.sse_subscribers --subscribers 5000 --events 20
+
+http 모드: 실행 중인 서버에 SSE 연결 N개를 열고 --duration 동안 유지하면서
+연결 성공 / 실패 수와 수신한 ping / 이벤트 수를 집계합니다. 유휴 연결이
+DB 풀을 점유하지 않는지는 /api/admin/pool-stats로 함께 확인합니다.
+
+    python -m benchmarks.sse_subscribers --base-url http://localhost:8000 \\
+        --subscribers 2000 --duration 60
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from app.services.event_broker import EventBroker, month_topic
+
+
+async def run_broker(subscribers: int, events: int) -> None:
+    broker = EventBroker(queue_size=100)
+    topic = month_topic(2026, 1)
+    ready = asyncio.Event()
+    received = []
+    connected = 0
+
+    async def subscriber():
+        nonlocal connected
+        async with broker.subscribe(topic) as queue:
+            connected += 1
+            if connected == subscribers:
+                ready.set()
+            while True:
+                event = await queue.get()
+                received.append(time.perf_counter() - event["sentAt"])
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(subscriber()) for _ in range(subscribers)]
+    await ready.wait()
+    subscribe_seconds = time.perf_counter() - started
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    fanout = []
+    for i in range(events):
+        received.clear()
+        sent_at = time.perf_counter()
+        await broker.publish(topic, {"type": "seats", "scheduleId": i, "delta": 1, "sentAt": sent_at})
+        while len(received) < subscribers:
+            await asyncio.sleep(0)
+        fanout.append(max(received))
+    stats = broker.stats()
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(f"subscribers={subscribers} events={events} mode=broker")
+    print(f"subscribe all: {subscribe_seconds * 1000:.1f} ms")
+    print(f"memory per subscriber: {(after - before) / subscribers / 1024:.2f} KiB")
+    print(f"fan-out to all subscribers: p50 {statistics.median(fanout) * 1000:.2f} ms, max {max(fanout) * 1000:.2f} ms")
+    print(f"broker stats: {stats}")
+
+
+async def run_http(base_url: str, subscribers: int, duration: float, year: int, month: int) -> None:
+    import httpx
+
+    counts = {"connected": 0, "failed": 0, "pings": 0, "events": 0}
+    url = f"{base_url.rstrip('/')}/api/schedules/stream"
+    limits = httpx.Limits(max_connections=subscribers, max_keepalive_connections=0)
+
+    async def subscriber(client: httpx.AsyncClient):
+        try:
+            async with client.stream("GET", url, params={"year": year, "month": month}) as response:
+                response.raise_for_status()
+                counts["connected"] += 1
+                async for line in response.aiter_lines():
+                    if line.startswith(": ping"):
+                        counts["pings"] += 1
+                    elif line.startswith("event:"):
+                        counts["events"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            counts["failed"] += 1
+
+    timeout = httpx.Timeout(10.0, read=None)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(subscriber(client)) for _ in range(subscribers)]
+        while counts["connected"] + counts["failed"] < subscribers and time.perf_counter() - started < duration:
+            await asyncio.sleep(0.1)
+        connect_seconds = time.perf_counter() - started
+
+        await asyncio.sleep(max(0.0, duration - connect_seconds))
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(f"subscribers={subscribers} duration={duration}s mode=http")
+    print(f"connect all: {connect_seconds:.2f} s")
+    print(f"connected={counts['connected']} failed={counts['failed']} pings={counts['pings']} events={counts['events']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=20, help="broker 모드에서 발행할 이벤트 수")
+    parser.add_argument("--base-url", help="지정 시 http 모드로 실행")
+    parser.add_argument("--duration", type=float, default=60.0, help="http 모드에서 연결 유지 시간 (초)")
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--month", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.base_url:
+        asyncio.run(run_http(args.base_url, args.subscribers, args.duration, args.year, args.month))
+    else:
+        asyncio.run(run_broker(args.subscribers, args.events))
+
+
+if __name__ == "__main__":
+    main()
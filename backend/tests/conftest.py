@@ -0,0 +1,75 @@
+"""
+테스트 공통 설정
+
+임시 SQLite 파일 DB에 테이블을 만들고, 앱을 httpx ASGITransport로 호출합니다.
+설정은 app 모듈을 import하기 전에 환경변수로 지정합니다.
+"""
+
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="jangan-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ["REDIS_URL"] = ""
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["REMINDER_ENABLED"] = "false"
+os.environ["FIREBASE_CREDENTIALS_PATH"] = ""
+
+import httpx
+import pytest
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models.user import AuthProvider, User, UserRole
+from app.services.cache import cache
+from app.utils.deps import principal_cache
+from app.utils.security import get_password_hash
+
+PASSWORD = "test-password"
+
+
+@pytest.fixture
+async def client():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    cache._data.clear()
+    principal_cache._data.clear()
+
+    await app.router.startup()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
+    await app.router.shutdown()
+
+
+async def create_user(email: str, role: UserRole = UserRole.USER, name: str = "테스트") -> int:
+    async with SessionLocal() as db:
+        user = User(
+            email=email,
+            password_hash=get_password_hash(PASSWORD),
+            name=name,
+            role=role,
+            provider=AuthProvider.EMAIL,
+        )
+        db.add(user)
+        await db.commit()
+        return user.id
+
+
+async def login(client: httpx.AsyncClient, email: str) -> dict:
+    """로그인 후 Authorization 헤더 반환"""
+    response = await client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+
+
+@pytest.fixture
+async def user_headers(client):
+    await create_user("user@example.com")
+    return await login(client, "user@example.com")
+
+
+@pytest.fixture
+async def admin_headers(client):
+    await create_user("admin@example.com", role=UserRole.ADMIN, name="관리자")
+    return await login(client, "admin@example.com")
@@ -0,0 +1,36 @@
+from app.models.user import UserRole
+from tests.conftest import create_user, login
+
+
+async def test_user_list_cursor_walk_returns_every_user_once(client, admin_headers):
+    for i in range(11):
+        await create_user(f"member{i}@example.com")
+
+    seen = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 5}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/admin/users", headers=admin_headers, params=params)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    # 관리자 1명 + 사용자 11명
+    assert len(seen) == 12
+    assert len(set(seen)) == 12
+
+
+async def test_demoted_admin_loses_access_before_token_expires(client, admin_headers):
+    other_id = await create_user("other-admin@example.com", role=UserRole.ADMIN)
+    other_headers = await login(client, "other-admin@example.com")
+    assert (await client.get("/api/admin/users", headers=other_headers)).status_code == 200
+
+    response = await client.put(f"/api/admin/users/{other_id}/role", headers=admin_headers, params={"role": "user"})
+    assert response.status_code == 200
+
+    # 같은 토큰이라도 역할은 DB / 인증 사용자 캐시 기준으로 확인
+    assert (await client.get("/api/admin/users", headers=other_headers)).status_code == 403
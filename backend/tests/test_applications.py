@@ -0,0 +1,39 @@
+import asyncio
+from datetime import date, time
+
+from app.database import SessionLocal
+from app.models.schedule import Schedule
+from app.models.user import UserRole
+from tests.conftest import create_user, login
+
+
+async def test_concurrent_applies_never_exceed_capacity(client):
+    capacity, applicants = 3, 10
+    admin_id = await create_user("admin@example.com", role=UserRole.ADMIN)
+    async with SessionLocal() as db:
+        schedule = Schedule(
+            title="전시대",
+            date=date(2030, 6, 1),
+            start_time=time(10),
+            end_time=time(12),
+            location="역 앞",
+            capacity=capacity,
+            created_by=admin_id,
+        )
+        db.add(schedule)
+        await db.commit()
+        schedule_id = schedule.id
+
+    headers = []
+    for i in range(applicants):
+        await create_user(f"a{i}@example.com")
+        headers.append(await login(client, f"a{i}@example.com"))
+
+    responses = await asyncio.gather(*(
+        client.post(f"/api/applications/{schedule_id}", headers=h) for h in headers
+    ))
+    codes = sorted(response.status_code for response in responses)
+
+    assert codes == [200] * capacity + [409] * (applicants - capacity)
+    detail = await client.get(f"/api/schedules/{schedule_id}", headers=headers[0])
+    assert detail.json()["applicantCount"] == capacity
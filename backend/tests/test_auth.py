@@ -0,0 +1,20 @@
+from tests.conftest import create_user, login
+
+
+async def test_login_and_me(client):
+    user_id = await create_user("me@example.com", name="봉사자")
+    headers = await login(client, "me@example.com")
+
+    response = await client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["id"] == user_id
+    assert response.json()["name"] == "봉사자"
+
+    # 두 번째 요청은 인증 사용자 캐시에서 조회
+    response = await client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 200
+
+
+async def test_protected_route_requires_token(client):
+    response = await client.get("/api/auth/me")
+    assert response.status_code in (401, 403)
@@ -0,0 +1,17 @@
+import time
+
+from app.config import settings
+from app.services.cache import cache
+from app.utils.http_cache import VERSION_KEY_PREFIX, bump_versions, get_versions
+
+
+async def test_versions_in_process_cache_expire_with_cache_ttl(client):
+    assert not cache.shared
+
+    await get_versions("notices")
+    await bump_versions("schedules:2030-05")
+
+    limit = time.monotonic() + settings.CACHE_TTL_SECONDS
+    for name in ("notices", "schedules:2030-05"):
+        expires_at, _ = cache._data[VERSION_KEY_PREFIX + name]
+        assert expires_at <= limit
@@ -0,0 +1,23 @@
+async def test_cursor_walk_returns_every_notice_once(client, admin_headers):
+    for i in range(12):
+        response = await client.post("/api/notices", headers=admin_headers, json={
+            "title": f"공지 {i}",
+            "content": "내용",
+            "isImportant": i % 4 == 0,
+        })
+        assert response.status_code == 200
+
+    seen = []
+    cursor = None
+    for _ in range(10):
+        params = {"pageSize": 5}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await client.get("/api/notices", headers=admin_headers, params=params)).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["nextCursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == 12
+    assert len(set(seen)) == 12
@@ -0,0 +1,30 @@
+from app.database import SessionLocal
+from app.models.notification import Notification
+from tests.conftest import create_user, login
+
+
+async def test_cursor_walk_returns_every_notification_once(client):
+    user_id = await create_user("n@example.com")
+    headers = await login(client, "n@example.com")
+    async with SessionLocal() as db:
+        db.add_all([Notification(user_id=user_id, title=f"알림 {i}", body="내용") for i in range(12)])
+        await db.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 5}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/notifications", headers=headers, params=params)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert len(seen) == 12
+    assert len(set(seen)) == 12
+
+    response = await client.get("/api/notifications/unread-count", headers=headers)
+    assert response.json() == {"count": 12}
@@ -0,0 +1,41 @@
+from app.services.push_service import FCM_BATCH_SIZE, FakeTransport, PushDispatcher
+
+
+async def test_dispatcher_chunks_retries_and_reports_per_token():
+    tokens = [f"token-{i}" for i in range(1201)]
+    transport = FakeTransport(failing_tokens={"token-7", "token-1200"}, transient_failures=1)
+    # 워커 1개: 첫 요청(첫 배치)이 일시적 오류로 실패
+    dispatcher = PushDispatcher(transport, workers=1, max_retries=3, backoff=0)
+
+    try:
+        results = await dispatcher.submit(tokens, "제목", "내용", {"type": "notice"})
+    finally:
+        await dispatcher.stop()
+
+    # FCM 한도(500) 단위 3개 배치, 실패한 첫 배치만 한 번 더 요청
+    assert [len(batch["tokens"]) for batch in transport.sent] == [FCM_BATCH_SIZE, FCM_BATCH_SIZE, 201]
+    assert [len(attempt) for attempt in transport.attempts] == [500, 500, 500, 201]
+    assert transport.attempts[0] == transport.attempts[1] == tokens[:500]
+    assert transport.sent[0]["data"] == {"type": "notice"}
+
+    # 토큰별 결과는 요청 순서대로, 잘못된 토큰은 재시도 없이 실패
+    assert [result.token for result in results] == tokens
+    failed = {result.token: result for result in results if not result.success}
+    assert set(failed) == {"token-7", "token-1200"}
+    assert not any(result.retryable for result in failed.values())
+    assert sum(result.success for result in results) == 1199
+
+
+async def test_dispatcher_gives_up_after_max_retries():
+    transport = FakeTransport(transient_failures=10)
+    dispatcher = PushDispatcher(transport, workers=1, max_retries=2, backoff=0)
+
+    try:
+        results = await dispatcher.submit(["a", "b"], "제목", "내용")
+    finally:
+        await dispatcher.stop()
+
+    assert len(transport.attempts) == 3
+    assert transport.sent == []
+    assert all(not result.success and result.retryable for result in results)
+    assert results[0].error == "UNAVAILABLE"
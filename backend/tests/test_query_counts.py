@@ -0,0 +1,75 @@
+"""요청당 SQL 문 수가 일정 개수와 무관한지 확인 (N+1 회귀 방지)"""
+
+from contextlib import contextmanager
+from datetime import date, time
+
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.models.application import Application
+from app.models.schedule import Schedule
+from app.services.cache import cache
+from tests.conftest import create_user
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def add_schedules(user_id: int, day: date, count: int, offset: int = 0) -> None:
+    async with SessionLocal() as db:
+        for i in range(offset, offset + count):
+            schedule = Schedule(
+                title=f"일정 {i}",
+                date=day,
+                start_time=time(8 + i % 12),
+                end_time=time(9 + i % 12),
+                location=f"장소 {i}",
+                capacity=5,
+                applicant_count=1,
+            )
+            db.add(schedule)
+            await db.flush()
+            db.add(Application(user_id=user_id, schedule_id=schedule.id))
+        await db.commit()
+
+
+async def statements_for(client, headers, url, params) -> int:
+    cache._data.clear()
+    with count_statements() as statements:
+        response = await client.get(url, headers=headers, params=params)
+    assert response.status_code == 200
+    return len(statements)
+
+
+async def test_schedule_reads_use_constant_number_of_statements(client, user_headers):
+    other_id = await create_user("other@example.com")
+    day = date(2030, 3, 14)
+    month = {"year": 2030, "month": 3}
+    by_date = {"date": day.isoformat()}
+
+    # 인증 사용자 캐시 채우기
+    user_id = (await client.get("/api/auth/me", headers=user_headers)).json()["id"]
+
+    await add_schedules(other_id, day, 2)
+    few_month = await statements_for(client, user_headers, "/api/schedules", month)
+    few_day = await statements_for(client, user_headers, "/api/schedules/by-date", by_date)
+
+    await add_schedules(user_id, day, 10, offset=2)
+    many_month = await statements_for(client, user_headers, "/api/schedules", month)
+    many_day = await statements_for(client, user_headers, "/api/schedules/by-date", by_date)
+
+    assert many_month == few_month
+    assert many_day == few_day
+    assert many_month <= 5
+    assert many_day <= 5
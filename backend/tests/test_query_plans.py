@@ -0,0 +1,23 @@
+from argparse import Namespace
+
+from app.commands import seed
+from app.commands.check_query_plans import check_plans
+from app.database import engine
+
+
+async def test_hot_queries_do_not_scan_large_tables(client):
+    args = Namespace(
+        preset="small",
+        seed=42,
+        anchor="2030-01-01",
+        reset=False,
+        email_pattern="seed{i}@example.com",
+        password="seed-password",
+    )
+    assert await seed.main(args) == 0
+
+    async with engine.connect() as conn:
+        failures = await check_plans(conn, min_rows=1000)
+        await conn.rollback()
+
+    assert failures == []
@@ -0,0 +1,41 @@
+from datetime import date, time
+
+from sqlalchemy import func, select, update
+
+from app.database import SessionLocal
+from app.models.application import Application
+from app.models.notification import Notification
+from app.models.schedule import Schedule
+from app.models.user import User
+from app.services import reminder_service
+from tests.conftest import create_user
+
+
+async def test_reminders_are_stored_and_pushed_once(client, monkeypatch):
+    pushed = []
+
+    async def fake_send(tokens, schedule_title):
+        pushed.extend(tokens)
+        return len(tokens)
+
+    monkeypatch.setattr(reminder_service, "send_reminder_notification", fake_send)
+
+    target = date(2030, 5, 1)
+    user_ids = [await create_user(f"r{i}@example.com") for i in range(3)]
+    async with SessionLocal() as db:
+        schedule = Schedule(title="전시대", date=target, start_time=time(10), end_time=time(12), location="역 앞")
+        db.add(schedule)
+        await db.flush()
+        for user_id in user_ids:
+            db.add(Application(user_id=user_id, schedule_id=schedule.id))
+        await db.execute(update(User).values(fcm_token="token"))
+        await db.commit()
+
+        assert await reminder_service.send_reminders_for(db, target) == 3
+        # 워커 중단 후 다른 워커가 다시 실행해도 중복 저장 / 발송하지 않음
+        assert await reminder_service.send_reminders_for(db, target) == 0
+
+        count = await db.scalar(select(func.count()).select_from(Notification))
+
+    assert count == 3
+    assert len(pushed) == 3
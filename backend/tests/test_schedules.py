@@ -0,0 +1,119 @@
+from app.schemas.schedule import BULK_MAX_SCHEDULES
+
+
+async def _month(client, headers, year, month):
+    response = await client.get("/api/schedules", headers=headers, params={"year": year, "month": month})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_moving_template_occurrence_records_exception(client, admin_headers):
+    # 2030-04-01은 월요일
+    response = await client.post("/api/schedules/templates", headers=admin_headers, json={
+        "title": "월요 전시대",
+        "weekday": 0,
+        "startTime": "10:00",
+        "endTime": "12:00",
+        "location": "역 앞",
+        "validFrom": "2030-04-01",
+        "validUntil": "2030-04-30",
+    })
+    assert response.status_code == 200
+    template_id = response.json()["id"]
+
+    items = await _month(client, admin_headers, 2030, 4)
+    occurrence = next(item for item in items if item["date"] == "2030-04-08")
+    assert occurrence["id"] < 0
+
+    response = await client.put(f"/api/schedules/{occurrence['id']}", headers=admin_headers, json={"date": "2030-04-09"})
+    assert response.status_code == 200
+    moved = response.json()
+    assert moved["id"] > 0
+    assert moved["date"] == "2030-04-09"
+    assert moved["templateId"] == template_id
+
+    dates = [item["date"] for item in await _month(client, admin_headers, 2030, 4)]
+    assert "2030-04-08" not in dates
+    assert dates.count("2030-04-09") == 1
+    assert dates.count("2030-04-15") == 1
+
+
+async def test_template_update_rejects_malformed_time(client, admin_headers):
+    response = await client.post("/api/schedules/templates", headers=admin_headers, json={
+        "title": "화요 전시대",
+        "weekday": 1,
+        "startTime": "10:00",
+        "endTime": "12:00",
+        "location": "시장 앞",
+        "validFrom": "2030-04-01",
+    })
+    template_id = response.json()["id"]
+
+    response = await client.put(f"/api/schedules/templates/{template_id}", headers=admin_headers, json={"startTime": "25:99"})
+    assert response.status_code == 400
+
+
+async def test_bulk_rejects_too_many_schedules(client, admin_headers):
+    schedules = [
+        {"title": "전시대", "date": "2030-05-01", "startTime": "10:00", "endTime": "12:00", "location": f"장소 {i}"}
+        for i in range(BULK_MAX_SCHEDULES + 1)
+    ]
+    response = await client.post("/api/schedules/bulk", headers=admin_headers, json={"schedules": schedules})
+    assert response.status_code == 422
+
+    response = await client.post("/api/schedules/bulk", headers=admin_headers, json={"schedules": schedules[:3]})
+    assert response.status_code == 200
+    assert response.json()["upserted"] == 3
+
+
+async def test_duplicate_slot_returns_conflict(client, admin_headers):
+    body = {"title": "전시대", "date": "2030-05-02", "startTime": "10:00", "endTime": "12:00"}
+    response = await client.post("/api/schedules", headers=admin_headers, json=body)
+    assert response.status_code == 200
+    response = await client.post("/api/schedules", headers=admin_headers, json=body)
+    assert response.status_code == 409
+
+    response = await client.post("/api/schedules", headers=admin_headers, json={**body, "startTime": "13:00", "endTime": "15:00"})
+    other_id = response.json()["id"]
+    response = await client.put(f"/api/schedules/{other_id}", headers=admin_headers, json={"startTime": "10:00"})
+    assert response.status_code == 409
+
+
+async def test_bulk_upsert_is_idempotent_without_location(client, admin_headers):
+    payload = {"schedules": [
+        {"title": "전시대", "date": "2030-05-03", "startTime": "10:00", "endTime": "12:00"},
+        {"title": "전시대", "date": "2030-05-03", "startTime": "13:00", "endTime": "15:00"},
+    ]}
+    for _ in range(2):
+        response = await client.post("/api/schedules/bulk", headers=admin_headers, json=payload)
+        assert response.status_code == 200
+
+    items = [item for item in await _month(client, admin_headers, 2030, 5) if item["date"] == "2030-05-03"]
+    assert len(items) == 2
+
+
+async def test_bulk_rejects_capacity_below_applicants(client, admin_headers, user_headers):
+    item = {"title": "전시대", "date": "2030-05-04", "startTime": "10:00", "endTime": "12:00", "location": "역 앞", "capacity": 3}
+    response = await client.post("/api/schedules/bulk", headers=admin_headers, json={"schedules": [item]})
+    assert response.status_code == 200
+    schedule_id = (await _month(client, admin_headers, 2030, 5))[0]["id"]
+    for headers in (user_headers, admin_headers):
+        response = await client.post(f"/api/applications/{schedule_id}", headers=headers)
+        assert response.status_code == 200
+
+    response = await client.post("/api/schedules/bulk", headers=admin_headers, json={"schedules": [{**item, "capacity": 1}]})
+    assert response.status_code == 409
+    response = await client.put(f"/api/schedules/{schedule_id}", headers=admin_headers, json={"capacity": 1})
+    assert response.status_code == 409
+    response = await client.post("/api/schedules/bulk", headers=admin_headers, json={"schedules": [{**item, "capacity": 2}]})
+    assert response.status_code == 200
+
+
+async def test_out_of_range_occurrence_id_returns_not_found(client, admin_headers):
+    for schedule_id in (-19999999, -10000000):
+        response = await client.get(f"/api/schedules/{schedule_id}")
+        assert response.status_code == 404
+        response = await client.put(f"/api/schedules/{schedule_id}", headers=admin_headers, json={"title": "변경"})
+        assert response.status_code == 404
+        response = await client.delete(f"/api/schedules/{schedule_id}", headers=admin_headers)
+        assert response.status_code == 404